@@ -2,7 +2,9 @@
 """
 Application Constants.
 Static values that do not change between simulation runs.
+Collections are tuples / read-only mappings so they can't be mutated by accident.
 """
+from types import MappingProxyType
 
 # Window Settings
 SCREEN_WIDTH = 2048
@@ -45,14 +47,18 @@ LOG_LINE_HEIGHT = 24
 LOG_PADDING_TOP = 20  # Padding from top of panel to first log entry
 UI_OPACITY_PANEL = 230
 UI_OPACITY_CENTER = 200
+COLOR_PANEL_TINT = (20, 20, 20)  # Dark grey fill under the translucent panels
 
 # Wealth Tiers
-WEALTH_TIERS = [10_000, 100_000, 1_000_000, 10_000_000]
+WEALTH_TIERS = (10_000, 100_000, 1_000_000, 10_000_000)
 
 # Time Settings
 START_YEAR = 2025
-MONTHS = ["January", "February", "March", "April", "May", "June", 
-          "July", "August", "September", "October", "November", "December"]
+MONTHS = ("January", "February", "March", "April", "May", "June", 
+          "July", "August", "September", "October", "November", "December")
+# Background season for each month index (0 = January)
+SEASON_BY_MONTH = ("winter", "winter", "spring", "spring", "spring", "summer",
+                   "summer", "summer", "autumn", "autumn", "autumn", "winter")
 
 # File Paths
 LOG_DIR = "logs"
@@ -60,6 +66,7 @@ CONFIG_FILE = "config.json"
 ASSETS_DIR = "assets"
 ICON_FT_FILENAME = "icon_ft.png"
 ASSETS_BG_DIR = "assets/backgrounds"
+HIGH_QUALITY_BG = True  # Bilinear (smoothscale) background scaling; False = faster nearest-neighbour
 
 # Social Graph Physics
 GRAPH_REPULSION = 500.0  # Strength of nodes pushing apart
@@ -67,6 +74,9 @@ GRAPH_CENTER_GRAVITY = 0.90 # Pull towards screen center
 GRAPH_FRICTION = 0.91     # Velocity damping (0.0 - 1.0)
 GRAPH_SPEED = 1.0         # Global speed multiplier
 GRAPH_ATTRACTION = 2.0    # Spring strength for connected nodes
+GRAPH_BARNES_HUT_MIN_NODES = 500  # Node count at which repulsion switches to Barnes-Hut
+GRAPH_BARNES_HUT_THETA = 1.2      # Opening angle (higher = faster, less exact)
+GRAPH_REPULSION_BLOCK = 64        # Target rows per tile in the exact repulsion kernel
 
 # Social Graph Relationship Force Multipliers
 GRAPH_WEAK_BOND_THRESHOLD = 30    # Relationship score for weak bonds
@@ -202,22 +212,22 @@ MOTHER_YOUNG_AGE = 20           # Age threshold for "young mother" description
 # ---------------------------------------------------------------------------
 # Physical Attributes System
 # ---------------------------------------------------------------------------
-COORDINATION_ATTRIBUTES = ["agility", "balance", "coordination", "reaction_time"]
-PERFORMANCE_ATTRIBUTES = ["flexibility", "speed", "power"]
+COORDINATION_ATTRIBUTES = ("agility", "balance", "coordination", "reaction_time")
+PERFORMANCE_ATTRIBUTES = ("flexibility", "speed", "power")
 
 # ---------------------------------------------------------------------------
 # Temperament System
 # ---------------------------------------------------------------------------
-TEMPERAMENT_TRAITS = ["Activity", "Regularity", "Approach_Withdrawal", "Adaptability", 
-                      "Threshold", "Intensity", "Mood", "Distractibility", "Persistence"]
+TEMPERAMENT_TRAITS = ("Activity", "Regularity", "Approach_Withdrawal", "Adaptability", 
+                      "Threshold", "Intensity", "Mood", "Distractibility", "Persistence")
 
-PLASTICITY_DECAY = {0: 1.0, 1: 0.6, 2: 0.3}
+PLASTICITY_DECAY = MappingProxyType({0: 1.0, 1: 0.6, 2: 0.3})
 
 TEMPERAMENT_DEFAULT_VALUE = 50.0
 
 # ---------------------------------------------------------------------------
 # Cognitive Aptitude System
 # ---------------------------------------------------------------------------
-APTITUDES = ["Analytical Reasoning", "Verbal Abilities", "Spatial Abilities", "Working Memory", "Long-term Memory", "Secondary Cognitive"]
+APTITUDES = ("Analytical Reasoning", "Verbal Abilities", "Spatial Abilities", "Working Memory", "Long-term Memory", "Secondary Cognitive")
 APTITUDE_MIN = 0
 APTITUDE_MAX = 180
\ No newline at end of file
@@ -2,13 +2,40 @@
 """
 Logging Configuration Module.
 Sets up console and file logging based on config.
+
+Hot paths (per-agent, per-frame) should log with %-style arguments,
+e.g. logger.debug("NPC %s earned $%s", name, salary), so records filtered
+out by level never pay for string formatting.
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from . import constants
 
+
+class _LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates its directory and file on the first record."""
+    
+    def __init__(self, filename):
+        super().__init__(filename, delay=True)
+    
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records as-is, leaving formatting to the listener."""
+    
+    def prepare(self, record):
+        # The queue is in-process, so the record needs no pickling-safe copy
+        return record
+
+
 def setup_logging(config: dict):
     """
     Configures the root logger.
@@ -19,10 +46,7 @@ def setup_logging(config: dict):
     log_level_str = config.get("logging", {}).get("level", "INFO")
     log_level = getattr(logging, log_level_str.upper(), logging.INFO)
     
-    # Create log directory if it doesn't exist
-    if not os.path.exists(constants.LOG_DIR):
-        os.makedirs(constants.LOG_DIR)
-        
+    # The log directory and file are only created once a record is written
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_filename = os.path.join(constants.LOG_DIR, f"run_{timestamp}.log")
     
@@ -32,15 +56,26 @@ def setup_logging(config: dict):
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
+    handlers = []
+    
     # Console Handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File Handler
     if config.get("logging", {}).get("save_to_file", True):
-        file_handler = logging.FileHandler(log_filename)
+        file_handler = _LazyFileHandler(log_filename)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Records are only enqueued on the calling thread; a listener thread
+    # does the formatting and console/file I/O
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_PassthroughQueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush whatever is still queued on interpreter shutdown
+    atexit.register(listener.stop)
         
     logging.info(f"Logging initialized. Level: {log_level_str}")
\ No newline at end of file
@@ -6,8 +6,12 @@ Handles loading and caching of background images.
 
 import pygame
 import os
+import bisect
 import logging
-from typing import Optional, Dict
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from life_sim import constants
 
@@ -15,9 +19,19 @@ from life_sim import constants
 class ResourceManager:
     """Manages loading and caching of background images."""
     
+    # Scaled surfaces kept before the least recently used one is evicted
+    MAX_CACHE = 16
+    # Decoded sources kept (~9 MB each at 2048x1088): two tiers' seasons
+    MAX_SOURCES = 8
+    
     def __init__(self):
         """Initialize the resource cache."""
-        self._cache: Dict[str, pygame.Surface] = {}
+        # Scaled, display-ready surfaces keyed by (filename, width, height), LRU order
+        self._cache: "OrderedDict[Tuple[str, int, int], pygame.Surface]" = OrderedDict()
+        # Decoded source images keyed by filename (None = failed to load), LRU order
+        self._source_cache: "OrderedDict[str, Optional[pygame.Surface]]" = OrderedDict()
+        # Guards _source_cache; sources may be decoded by the preload thread
+        self._source_lock = threading.Lock()
     
     def get_image(self, filename: str, screen_width: int = None, screen_height: int = None) -> Optional[pygame.Surface]:
         """
@@ -31,36 +45,136 @@ class ResourceManager:
         Returns:
             pygame.Surface: The loaded and scaled image surface, or None if failed
         """
+        if screen_width is None or screen_height is None:
+            # Fallback to original constants if dimensions not provided
+            screen_width = constants.SCREEN_WIDTH
+            screen_height = constants.SCREEN_HEIGHT
+
         # Create cache key that includes dimensions
-        cache_key = f"{filename}_{screen_width}_{screen_height}"
+        cache_key = (filename, screen_width, screen_height)
         
         # Check cache first
         if cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
             return self._cache[cache_key]
         
+        # Decode once per file; resizes only pay for the rescale
+        image = self._get_source(filename)
+        if image is None:
+            return None
+        if image.get_bitsize() != 32:
+            image = self._widen_source(filename, image)
+        
+        # Scale to screen size while maintaining aspect ratio
+        scaled_image = self._scale_to_fit_screen(image, screen_width, screen_height)
+        
+        # Convert for performance (skipped when already in display format,
+        # which the 32-bit XRGB sources usually produce)
+        if self._matches_display(scaled_image):
+            converted_image = scaled_image
+        else:
+            converted_image = scaled_image.convert()
+        
+        # Cache and return
+        self._cache[cache_key] = converted_image
+        if len(self._cache) > self.MAX_CACHE:
+            # Full-screen surfaces are large; drop the least recently used
+            self._cache.popitem(last=False)
+        return converted_image
+    
+    def _get_source(self, filename: str) -> Optional[pygame.Surface]:
+        """
+        Load and cache the unscaled source image for a filename.
+        Failures are cached too, so a missing file is only looked up once.
+        
+        Args:
+            filename: The image filename to load
+            
+        Returns:
+            pygame.Surface: The decoded image, or None if it could not be loaded
+        """
+        with self._source_lock:
+            if filename in self._source_cache:
+                self._source_cache.move_to_end(filename)
+                return self._source_cache[filename]
+        
         # Construct full path
         full_path = os.path.join(constants.ASSETS_BG_DIR, filename)
         
+        image = None
         try:
-            # Load the image
+            # Decode only: image.load needs no display, so this is safe on the
+            # preload thread. Widening to 32-bit happens in get_image.
             image = pygame.image.load(full_path)
-            
-            # Scale to screen size while maintaining aspect ratio
-            scaled_image = self._scale_to_fit_screen(image, screen_width, screen_height)
-            
-            # Convert for performance
-            converted_image = scaled_image.convert()
-            
-            # Cache and return
-            self._cache[cache_key] = converted_image
-            return converted_image
-            
         except pygame.error as e:
             logging.warning(f"Failed to load background image '{filename}': {e}")
-            return None
         except FileNotFoundError:
             logging.warning(f"Background image file not found: {full_path}")
-            return None
+        
+        # Decoding happens outside the lock; if two threads raced, keep the first
+        with self._source_lock:
+            image = self._source_cache.setdefault(filename, image)
+            if len(self._source_cache) > self.MAX_SOURCES:
+                # Full-size sources are large; drop the least recently used
+                self._source_cache.popitem(last=False)
+            return image
+    
+    def _widen_source(self, filename: str, image: pygame.Surface) -> pygame.Surface:
+        """
+        Convert a decoded source to 32-bit and keep that copy as the source.
+        
+        PNGs decode to 24-bit, and smoothscale only has SIMD paths for 32-bit
+        surfaces (~3-4x faster). convert() needs an initialized display, so
+        this runs on the main thread from get_image, never on the preload
+        thread; without a display it raises instead of caching a failure.
+        
+        Args:
+            filename: The image filename the source is cached under
+            image: The decoded source image
+            
+        Returns:
+            pygame.Surface: The 32-bit source image
+        """
+        image = image.convert(32)
+        with self._source_lock:
+            if filename in self._source_cache:
+                self._source_cache[filename] = image
+        return image
+    
+    def preload(self, filenames):
+        """
+        Decode source images ahead of time (safe to call off the main thread).
+        Only decodes; widening to 32-bit, scaling and convert() still happen
+        lazily on the main thread in get_image.
+        Files that don't exist are skipped silently.
+        
+        Args:
+            filenames: Iterable of image filenames to decode
+        """
+        for filename in filenames:
+            if os.path.exists(os.path.join(constants.ASSETS_BG_DIR, filename)):
+                self._get_source(filename)
+    
+    @staticmethod
+    def _matches_display(surface: pygame.Surface) -> bool:
+        """Whether surface already has the display's pixel format (blits without conversion)."""
+        display = pygame.display.get_surface()
+        return (display is not None
+                and surface.get_bitsize() == display.get_bitsize()
+                and surface.get_masks() == display.get_masks())
+    
+    def prewarm(self, filename: str, screen_width: int = None, screen_height: int = None):
+        """
+        Scale and cache an image for a screen size ahead of its first use.
+        Files that don't exist are skipped silently.
+        
+        Args:
+            filename: The image filename to prepare
+            screen_width: Screen width to scale for
+            screen_height: Screen height to scale for
+        """
+        if os.path.exists(os.path.join(constants.ASSETS_BG_DIR, filename)):
+            self.get_image(filename, screen_width, screen_height)
     
     def _scale_to_fit_screen(self, image: pygame.Surface, screen_width: int, screen_height: int) -> pygame.Surface:
         """
@@ -90,38 +204,37 @@ class ResourceManager:
         # Use the LARGER ratio to ensure image covers entire screen
         scale_ratio = max(width_ratio, height_ratio)
         
-        # Calculate new dimensions
-        new_width = int(img_width * scale_ratio)
-        new_height = int(img_height * scale_ratio)
-        
-        # Scale the image
-        scaled_image = pygame.transform.smoothscale(image, (new_width, new_height))
+        # Crop the source to the region that will be visible, centered, and
+        # scale only that straight to screen size. Scaling the whole image
+        # and cropping afterwards resamples pixels that are thrown away.
+        crop_width = min(img_width, max(1, round(screen_width / scale_ratio)))
+        crop_height = min(img_height, max(1, round(screen_height / scale_ratio)))
+        crop_x = (img_width - crop_width) // 2
+        crop_y = (img_height - crop_height) // 2
+        visible = image.subsurface((crop_x, crop_y, crop_width, crop_height))
         
-        # Calculate crop position to center the image
-        crop_x = (new_width - screen_width) // 2
-        crop_y = (new_height - screen_height) // 2
-        
-        # Create a surface the size of the screen
-        final_surface = pygame.Surface((screen_width, screen_height))
-        
-        # If the scaled image is larger than screen, crop and center it
-        if new_width >= screen_width and new_height >= screen_height:
-            final_surface.blit(scaled_image, (0, 0), (crop_x, crop_y, screen_width, screen_height))
-        else:
-            # Fallback (shouldn't happen with max ratio, but just in case)
-            x = (screen_width - new_width) // 2
-            y = (screen_height - new_height) // 2
-            final_surface.fill(constants.COLOR_BG_FALLBACK)
-            final_surface.blit(scaled_image, (x, y))
-        
-        return final_surface
+        if constants.HIGH_QUALITY_BG:
+            return pygame.transform.smoothscale(visible, (screen_width, screen_height))
+        return pygame.transform.scale(visible, (screen_width, screen_height))
     
     def clear_cache(self):
         """Clear all cached images."""
         self._cache.clear()
+        with self._source_lock:
+            self._source_cache.clear()
         logging.debug("Background image cache cleared")
 
 
+# Bound once; _get_wealth_tier bisects into it for every tier lookup
+_WEALTH_TIERS = constants.WEALTH_TIERS
+
+
+@lru_cache(maxsize=64)
+def _background_filename(location: str, tier: int, season: str) -> str:
+    """Build the asset filename for a (location, tier, season) combination."""
+    return f"{location}_tier{tier}_{season}.png"
+
+
 class BackgroundManager:
     """Manages dynamic background selection and rendering."""
     
@@ -130,8 +243,36 @@ class BackgroundManager:
         self.resource_manager = ResourceManager()
         self.current_bg = None
         self.current_bg_name = ""
+        # Background with panel tints baked in; rebuilt when either changes
+        self._composited = None
+        self._composited_for = None
+        self._current_key = None
+        self._last_inputs = None
+        # Sibling seasons still to be scaled for the current tier and size
+        self._pending_prewarm = []
         self._last_screen_width = None
         self._last_screen_height = None
+        # Decodes the current tier's other seasons (see _start_preload)
+        self._preload_thread = None
+    
+    def _start_preload(self, filenames):
+        """
+        Decode the given sources on a daemon thread, so the first appearance
+        of a season doesn't stall a frame. Only the current tier's seasons are
+        decoded; the player sees one location and tier at a time.
+        
+        Args:
+            filenames: List of image filenames to decode
+        """
+        self._preload_thread = threading.Thread(
+            target=self.resource_manager.preload, args=(filenames,),
+            name="BackgroundPreload", daemon=True
+        )
+        self._preload_thread.start()
+    
+    def _preloading(self):
+        """Whether the preload thread is still decoding."""
+        return self._preload_thread is not None and self._preload_thread.is_alive()
     
     def _get_season(self, month_index):
         """
@@ -143,14 +284,7 @@ class BackgroundManager:
         Returns:
             str: "winter", "spring", "summer", or "autumn"
         """
-        if month_index in [11, 0, 1]:
-            return "winter"
-        elif month_index in [2, 3, 4]:
-            return "spring"
-        elif month_index in [5, 6, 7]:
-            return "summer"
-        else:  # [8, 9, 10]
-            return "autumn"
+        return constants.SEASON_BY_MONTH[month_index]
     
     def _get_wealth_tier(self, sim_state):
         """
@@ -165,17 +299,15 @@ class BackgroundManager:
         total_wealth = sim_state.player.money
         
         # If player is under 18, add parents' wealth
-        if sim_state.player.age < 18:
-            for rel_uid, relationship in sim_state.player.relationships.items():
-                if relationship.rel_type in ["Mother", "Father"] and rel_uid in sim_state.npcs:
-                    total_wealth += sim_state.npcs[rel_uid].money
-        
-        # Determine wealth tier
-        for i, threshold in enumerate(constants.WEALTH_TIERS):
-            if total_wealth < threshold:
-                return i + 1
+        # Agent.parents is fixed at birth, so no relationship scan is needed
+        if sim_state.player.age < 18 and sim_state.player.parents:
+            for parent in sim_state.player.parents:
+                if parent.uid in sim_state.npcs:
+                    total_wealth += parent.money
         
-        return 5  # Highest tier if above all thresholds
+        # Determine wealth tier: 1 + number of thresholds reached
+        # (bisect_right so wealth exactly on a threshold moves up a tier)
+        return bisect.bisect_right(_WEALTH_TIERS, total_wealth) + 1
     
     def update(self, sim_state, screen_width: int = None, screen_height: int = None):
         """
@@ -186,6 +318,27 @@ class BackgroundManager:
             screen_width: Current screen width for scaling
             screen_height: Current screen height for scaling
         """
+        # Calls made without dimensions (e.g. right after a turn) keep the current size
+        if screen_width is None and screen_height is None:
+            screen_width = self._last_screen_width
+            screen_height = self._last_screen_height
+        
+        # Scale at most one upcoming season per frame, so a tier or size
+        # change never stalls a single frame (or a resize drag) for all four.
+        # Waits for the preload thread so the decode stays off this thread.
+        if self._pending_prewarm and not self._preloading():
+            self.resource_manager.prewarm(self._pending_prewarm.pop(), screen_width, screen_height)
+        
+        # Called every frame, but the inputs only change on turn processing.
+        # Parents' wealth is deliberately not part of the signature: it is
+        # picked up on the next month rollover.
+        player = sim_state.player
+        signature = (sim_state.year, sim_state.month_index, player.age, player.money,
+                     screen_width, screen_height)
+        if signature == self._last_inputs:
+            return
+        self._last_inputs = signature
+        
         # Determine location
         # Check if it's the player's birth month (year 0, birth month)
         if sim_state.player.age == 0 and sim_state.month_index == sim_state.birth_month_index:
@@ -197,24 +350,66 @@ class BackgroundManager:
         season = self._get_season(sim_state.month_index)
         tier = self._get_wealth_tier(sim_state)
         
-        # Construct filename
-        target_name = f"{location}_tier{tier}_{season}.png"
-        
         # Only load new background if it's different
-        if target_name != self.current_bg_name or screen_width != self._last_screen_width or screen_height != self._last_screen_height:
+        key = (location, tier, season)
+        size_changed = screen_width != self._last_screen_width or screen_height != self._last_screen_height
+        if key != self._current_key or size_changed:
+            new_tier = self._current_key is None or key[:2] != self._current_key[:2]
+            if size_changed or new_tier:
+                # New tier or resolution: the next season changes will need these
+                self._pending_prewarm = [
+                    _background_filename(location, tier, other)
+                    for other in dict.fromkeys(constants.SEASON_BY_MONTH) if other != season
+                ]
+                if new_tier:
+                    self._start_preload(list(self._pending_prewarm))
+            target_name = _background_filename(location, tier, season)
             self.current_bg = self.resource_manager.get_image(target_name, screen_width, screen_height)
+            self._composited = None
             self.current_bg_name = target_name
+            self._current_key = key
             self._last_screen_width = screen_width
             self._last_screen_height = screen_height
     
-    def draw(self, screen):
+    def draw(self, screen, tints=()):
         """
         Draw the current background to the screen.
         
+        Translucent panel fills are composited into a cached copy of the
+        background once, so each frame is a single opaque blit instead of a
+        full-screen blit plus alpha-blended overlays.
+        
         Args:
             screen: pygame surface to draw on
+            tints: Tuple of (rect, color, alpha) translucent panel fills
         """
+        size = screen.get_size()
+        if self._composited is None or self._composited_for != (size, tints):
+            self._composited = self._composite(size, tints)
+            self._composited_for = (size, tints)
+        screen.blit(self._composited, (0, 0))
+    
+    def _composite(self, size, tints):
+        """
+        Build the background surface with panel tints applied.
+        
+        Args:
+            size: (width, height) of the target screen
+            tints: Tuple of (rect, color, alpha) translucent panel fills
+            
+        Returns:
+            pygame.Surface: Opaque surface ready to blit at (0, 0)
+        """
+        surface = pygame.Surface(size).convert()
         if self.current_bg is not None:
-            screen.blit(self.current_bg, (0, 0))
+            surface.blit(self.current_bg, (0, 0))
         else:
-            screen.fill(constants.COLOR_BG_FALLBACK)
+            surface.fill(constants.COLOR_BG_FALLBACK)
+        
+        for rect, color, alpha in tints:
+            overlay = pygame.Surface((rect[2], rect[3]))
+            overlay.set_alpha(alpha)
+            overlay.fill(color)
+            surface.blit(overlay, (rect[0], rect[1]))
+        
+        return surface
@@ -5,6 +5,13 @@ Handles graph traversal, rank assignment, and geometry calculation
 using a layered graph drawing approach with virtual marriage nodes.
 """
 import logging
+from collections import deque
+from operator import attrgetter
+
+import numpy as np
+
+# C-level sort key for the collision passes (runs ~10x per layer per build)
+_node_x = attrgetter('x')
 
 class LayoutNode:
     """Represents an entity in the layout graph (Agent or Marriage Hub)."""
@@ -25,6 +32,7 @@ class LayoutNode:
         self.parents = []   # Nodes above
         self.children = []  # Nodes below
         self.spouses = []   # Nodes on same rank (only for Agents)
+        self.parent_uids = [] # Father/Mother uids from relationships (filled during harvest)
 
 class FamilyTreeLayout:
     """
@@ -35,6 +43,18 @@ class FamilyTreeLayout:
         self.logger = logging.getLogger(__name__)
         self.nodes = {} # uid -> LayoutNode
         self.edges = [] # List of (start_node, end_node, type)
+        # Routed edge geometry in layout coordinates, one array per link type:
+        # SpouseLink segments (E, 2, 2) and ChildLink bus polylines (E, 4, 2)
+        self.spouse_link_points = np.empty((0, 2, 2))
+        self.child_link_points = np.empty((0, 4, 2))
+        # Bounding boxes (left, top, right, bottom) in layout coordinates, so
+        # the renderer can cull against the view with one array comparison:
+        # one row per link above, and one per agent node in agent_nodes
+        self.spouse_link_bounds = np.empty((0, 4))
+        self.child_link_bounds = np.empty((0, 4))
+        self.agent_nodes = [] # Agent (non-hub) nodes in self.nodes order
+        self.agent_node_bounds = np.empty((0, 4))
+        self._agent_rows = {} # y -> agent nodes on that layer (hit-testing)
         
         # Layout Constants
         self.GAP_X = 40
@@ -43,16 +63,16 @@ class FamilyTreeLayout:
 
     def get_node_at(self, rel_x, rel_y):
         """Returns the agent at the given relative coordinates, or None."""
-        for node in self.nodes.values():
-            if node.is_hub: continue
+        # Rows share one Y and height, so only the row under the cursor is scanned
+        for row_y, row in self._agent_rows.items():
+            half_h = row[0].height // 2
+            if not (row_y - half_h <= rel_y <= row_y + half_h): continue
             
-            left = node.x - node.width // 2
-            right = node.x + node.width // 2
-            top = node.y - node.height // 2
-            bottom = node.y + node.height // 2
-            
-            if left <= rel_x <= right and top <= rel_y <= bottom:
-                return node.agent
+            for node in row:
+                x = node.x
+                half_w = node.width // 2
+                if x - half_w <= rel_x <= x + half_w:
+                    return node.agent
         return None
 
     def build(self, focus_agent, all_agents_lookup):
@@ -61,11 +81,12 @@ class FamilyTreeLayout:
         """
         self.nodes = {}
         self.edges = []
+        self._agent_rows = {}
         
         # --- Phase 1: Harvest (BFS) ---
         # Collect all related agents and assign Generations relative to Focus
         visited_uids = set()
-        queue = [(focus_agent, 0)] # (Agent, Generation)
+        queue = deque([(focus_agent, 0)]) # (Agent, Generation)
         visited_uids.add(focus_agent.uid)
         
         # Only traverse direct family relationships to prevent merging all families
@@ -75,18 +96,24 @@ class FamilyTreeLayout:
         agent_gen_map = {focus_agent.uid: 0}
         
         while queue:
-            current_agent, gen = queue.pop(0)
+            current_agent, gen = queue.popleft()
             
             # Create Node
             if current_agent.uid not in self.nodes:
                 self.nodes[current_agent.uid] = LayoutNode(current_agent.uid, gen, agent=current_agent)
+            current_node = self.nodes[current_agent.uid]
             
             # Traverse Relationships
             for rel_uid, rel in current_agent.relationships.items():
-                if rel_uid not in all_agents_lookup: continue
-                
                 rel_type = rel.rel_type
                 
+                # Record parents once here; later phases read node.parent_uids
+                # instead of rescanning every relationship
+                if rel_type in ("Father", "Mother"):
+                    current_node.parent_uids.append(rel_uid)
+                
+                if rel_uid not in all_agents_lookup: continue
+                
                 # Only traverse direct family relationships to prevent merging all families
                 if rel_type not in ALLOWED_REL_TYPES: continue
                 
@@ -107,7 +134,7 @@ class FamilyTreeLayout:
 
         # --- Phase 2: Topology (Marriage Nodes) ---
         # Identify unions and insert Hub Nodes
-        # Key: tuple(sorted(spouse_uids)) -> hub_node
+        # Key: frozenset(spouse_uids) -> hub_node
         marriage_hubs = {}
         
         # Iterate over a static list of items to allow modifying self.nodes inside the loop
@@ -117,15 +144,16 @@ class FamilyTreeLayout:
             
             # 1. Link to Parents via Marriage Hub
             # Find parents in the harvested set
-            parents = [r_uid for r_uid, r in agent.relationships.items() 
-                       if r.rel_type in ["Father", "Mother"] and r_uid in self.nodes]
+            parents = [p_uid for p_uid in node.parent_uids if p_uid in self.nodes]
             
             if parents:
-                parents.sort()
-                pkey = tuple(parents)
+                # Order-free key: siblings hit the same hub without sorting
+                pkey = frozenset(parents)
                 
                 # Create Hub if missing
                 if pkey not in marriage_hubs:
+                    # Sorted only here, for a stable hub uid and parent order
+                    parents.sort()
                     # Hub generation is parents' generation
                     p_gen = self.nodes[parents[0]].generation
                     hub_uid = f"HUB_{'-'.join(parents)}"
@@ -213,7 +241,7 @@ class FamilyTreeLayout:
                 family_pos = 0
                 if n.parents:
                     # Average X of parent hubs
-                    family_pos = sum(p.x for p in n.parents) / len(n.parents)
+                    family_pos = self._mean_x(n.parents)
                 else:
                     # No parents (Roots): Sort by Age only (via secondary key)
                     # We use a constant to treat them as one "group"
@@ -238,48 +266,14 @@ class FamilyTreeLayout:
             layers[gen] = ordered_nodes
                 
         # Relaxation Loop (Iterative Force-Directed Layout)
-        # We alternate between centering nodes (Springs) and preventing overlap (Collisions).
-        for _ in range(5): # Increased iterations for stability
-            
-            # --- 1. Down Sweep (Parents pull Children) ---
-            for gen in sorted_gens:
-                for node in layers[gen]:
-                    if node.is_hub and node.parents:
-                        # Hub snaps to center of parents
-                        avg_p = sum(p.x for p in node.parents) / len(node.parents)
-                        node.x = avg_p
-                    elif not node.is_hub and node.parents:
-                        # Child pulls towards Parent Hub
-                        avg_p = sum(p.x for p in node.parents) / len(node.parents)
-                        node.x = (node.x + avg_p) / 2
-
-            # --- 2. Collision Resolution (Down) ---
-            for gen in sorted_gens:
-                self._resolve_collisions(layers[gen])
-
-            # --- 3. Up Sweep (Children pull Parents) ---
-            for gen in reversed(sorted_gens):
-                for node in layers[gen]:
-                    if node.is_hub and node.children:
-                        # Hub pulls towards center of children
-                        avg_c = sum(c.x for c in node.children) / len(node.children)
-                        node.x = avg_c
-                    elif not node.is_hub and node.spouses:
-                        # Parent pulls towards their Marriage Hubs
-                        avg_s = sum(s.x for s in node.spouses) / len(node.spouses)
-                        node.x = (node.x + avg_s) / 2
-
-            # --- 4. Collision Resolution (Up) ---
-            for gen in sorted_gens:
-                self._resolve_collisions(layers[gen])
+        self._relax([layers[gen] for gen in sorted_gens])
 
         # --- Phase 3b: Final Polish ---
         # Collision resolution shifts agents, which might de-center the Marriage Hubs.
         # We force-snap Hubs back to the exact center of their spouses to ensure perfect T-shapes.
         for node in self.nodes.values():
             if node.is_hub and node.parents:
-                avg_p = sum(p.x for p in node.parents) / len(node.parents)
-                node.x = avg_p
+                node.x = self._mean_x(node.parents)
 
         # --- Phase 4: Edge Generation ---
         # Convert node links to renderable edges
@@ -293,26 +287,125 @@ class FamilyTreeLayout:
                 for p in node.parents: # p is a Hub
                     self.edges.append((p, node, "ChildLink"))
 
+        # Pre-route the edges once: positions are final, so the renderer only
+        # has to offset these arrays instead of re-deriving points per frame
+        spouse_links = []
+        child_links = []
+        for start, end, link_type in self.edges:
+            if link_type == "SpouseLink":
+                # Straight line from parent to hub (same layer)
+                spouse_links.append(((start.x, start.y), (end.x, end.y)))
+            else:
+                # "Bus" routing: down from hub, across to child, down to child top
+                mid_y = start.y + (self.LAYER_HEIGHT // 2)
+                child_links.append(((start.x, start.y), (start.x, mid_y),
+                                    (end.x, mid_y), (end.x, end.y - (end.height // 2))))
+        self.spouse_link_points = np.array(spouse_links, dtype=float).reshape(-1, 2, 2)
+        self.child_link_points = np.array(child_links, dtype=float).reshape(-1, 4, 2)
+        self.spouse_link_bounds = self._polyline_bounds(self.spouse_link_points)
+        self.child_link_bounds = self._polyline_bounds(self.child_link_points)
+
+        # Agent nodes in draw order, with their boxes for view culling
+        self.agent_nodes = [node for node in self.nodes.values() if not node.is_hub]
+        self.agent_node_bounds = np.array(
+            [(n.x - n.width / 2, n.y - n.height / 2, n.x + n.width / 2, n.y + n.height / 2)
+             for n in self.agent_nodes], dtype=float).reshape(-1, 4)
+
+        # Bucket agent nodes by layer for get_node_at
+        for node in self.agent_nodes:
+            self._agent_rows.setdefault(node.y, []).append(node)
+
         # --- Phase 5: Bloodline Tagging ---
         self._mark_blood_relatives(focus_agent.uid)
+
+    def _relax(self, top_down, iterations=5):
+        """
+        Alternates between centering nodes (Springs) and preventing overlap (Collisions).
+        top_down holds the layer lists from the oldest generation down; they are
+        re-sorted in place by the collision passes.
+        """
+        # Sweeps stay sequential (Gauss-Seidel): a hub reads whichever of its
+        # spouses were already moved this sweep, and layer order depends on that.
+        # Everything touched per node is bound to a local up front.
+        mean_x = self._mean_x
+        resolve = self._resolve_collisions
+        bottom_up = top_down[::-1]
+        for _ in range(iterations): # Increased iterations for stability
+            
+            # --- 1. Down Sweep (Parents pull Children) ---
+            for layer in top_down:
+                for node in layer:
+                    parents = node.parents
+                    if not parents: continue
+                    if node.is_hub:
+                        # Hub snaps to center of parents
+                        node.x = mean_x(parents)
+                    else:
+                        # Child pulls towards Parent Hub
+                        node.x = (node.x + mean_x(parents)) / 2
+
+            # --- 2. Collision Resolution (Down) ---
+            for layer in top_down:
+                resolve(layer)
+
+            # --- 3. Up Sweep (Children pull Parents) ---
+            for layer in bottom_up:
+                for node in layer:
+                    if node.is_hub:
+                        children = node.children
+                        if children:
+                            # Hub pulls towards center of children
+                            node.x = mean_x(children)
+                    else:
+                        spouses = node.spouses
+                        if spouses:
+                            # Parent pulls towards their Marriage Hubs
+                            node.x = (node.x + mean_x(spouses)) / 2
+
+            # --- 4. Collision Resolution (Up) ---
+            for layer in top_down:
+                resolve(layer)
+
+    @staticmethod
+    def _polyline_bounds(points):
+        """(E, 4) left, top, right, bottom of each polyline in an (E, P, 2) array."""
+        return np.concatenate((points.min(axis=1), points.max(axis=1)), axis=1)
+
+    @staticmethod
+    def _mean_x(nodes):
+        """Average X of a non-empty node list (same result as sum()/len())."""
+        count = len(nodes)
+        if count == 1:
+            return float(nodes[0].x)
+        if count == 2:
+            return (nodes[0].x + nodes[1].x) / 2
+        return sum([n.x for n in nodes]) / count
+
     def _resolve_collisions(self, layer_nodes):
         """Enforces minimum spacing between nodes in a layer."""
         # Sort by current X to find neighbors
-        layer_nodes.sort(key=lambda n: n.x)
+        layer_nodes.sort(key=_node_x)
+        
+        if not layer_nodes:
+            return
         
-        # Push Right (A -> B)
-        for i in range(len(layer_nodes) - 1):
-            n1 = layer_nodes[i]
-            n2 = layer_nodes[i+1]
-            min_dist = (n1.width / 2) + (n2.width / 2) + self.GAP_X
-            if n2.x < n1.x + min_dist:
-                n2.x = n1.x + min_dist
+        # Push Right (A -> B), carrying the previous node's X and half-width
+        # instead of re-reading both nodes of every pair
+        gap_x = self.GAP_X
+        prev_x = layer_nodes[0].x
+        prev_half = layer_nodes[0].width / 2
+        for node in layer_nodes[1:]:
+            half = node.width / 2
+            min_x = prev_x + (prev_half + half + gap_x)
+            if node.x < min_x:
+                node.x = min_x
+            prev_x = node.x
+            prev_half = half
         
         # Re-center layer around 0 to prevent drift
-        if layer_nodes:
-            center = (layer_nodes[0].x + layer_nodes[-1].x) / 2
-            for node in layer_nodes:
-                node.x -= center
+        center = (layer_nodes[0].x + layer_nodes[-1].x) / 2
+        for node in layer_nodes:
+            node.x -= center
 
     def _mark_blood_relatives(self, focus_uid):
         """
@@ -321,35 +414,38 @@ class FamilyTreeLayout:
         # 1. Helper to get all ancestors (Parents, GPs, etc.) of a specific agent
         def get_ancestors(start_uid):
             ancestors = set()
-            queue = [start_uid]
+            queue = deque([start_uid])
             while queue:
-                curr = queue.pop(0)
+                curr = queue.popleft()
                 if curr in ancestors: continue
                 ancestors.add(curr)
                 
                 if curr in self.nodes and self.nodes[curr].agent:
-                    agent = self.nodes[curr].agent
-                    for rel_uid, rel in agent.relationships.items():
-                        if rel.rel_type in ["Father", "Mother"]:
-                            queue.append(rel_uid)
+                    queue.extend(self.nodes[curr].parent_uids)
             return ancestors
 
         # 2. Get Focus Agent's Ancestors
         focus_ancestors = get_ancestors(focus_uid)
         
-        # 3. Check every node in the graph
+        # 3. Sharing an ancestor with the focus means descending from one of
+        # focus_ancestors (get_ancestors includes self, so the focus counts).
+        # One downward walk from that set replaces an ancestor BFS per node.
+        children_by_uid = {}
         for uid, node in self.nodes.items():
             if node.is_hub or not node.agent:
                 continue
-                
-            # Get this node's ancestors
-            my_ancestors = get_ancestors(uid)
-            
-            # Intersection check: Do we share ANY ancestor?
-            # (Note: get_ancestors includes self, so if I am the focus, I share myself)
-            common = focus_ancestors.intersection(my_ancestors)
-            
-            if common:
+            node.is_blood = False
+            for p_uid in node.parent_uids:
+                children_by_uid.setdefault(p_uid, []).append(uid)
+        
+        queue = deque(focus_ancestors)
+        reached = set(focus_ancestors)
+        while queue:
+            curr = queue.popleft()
+            node = self.nodes.get(curr)
+            if node is not None and node.agent:
                 node.is_blood = True
-            else:
-                node.is_blood = False
\ No newline at end of file
+            for child_uid in children_by_uid.get(curr, ()):
+                if child_uid not in reached:
+                    reached.add(child_uid)
+                    queue.append(child_uid)
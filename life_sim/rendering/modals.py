@@ -3,8 +3,18 @@
 Modal Dialog Components.
 Displays interactive dialogs and events to the user.
 """
+from functools import lru_cache
+
 import pygame
 from .. import constants
+from .ui import render_text
+
+
+@lru_cache(maxsize=None)
+def _get_font(size: int) -> pygame.font.Font:
+    """Default-font instance for a size, shared by every modal."""
+    return pygame.font.Font(None, size)
+
 
 class EventModal:
     """
@@ -21,50 +31,59 @@ class EventModal:
         """
         self.rect = rect
         self.event_data = event_data
-        self.font_title = pygame.font.Font(None, 32)
-        self.font_text = pygame.font.Font(None, 24)
-        self.choice_buttons = []  # List of (rect, choice_text) tuples
-        self.selected_choices = []  # List of selected choice indices
+        self.font_title = _get_font(32)
+        self.font_text = _get_font(24)
+        self.choice_buttons = []  # List of (rect, choice, index) tuples, built once by _build_layout
+        # Selected choice indices as dict keys: O(1) membership and removal,
+        # while keeping click order (effects are applied in that order)
+        self.selected_choices = {}
         self.confirm_button = None  # Rect for confirm button
         self.hovered_choice = None  # Index of currently hovered choice
+        # Pre-rasterized buttons keyed by (choice index or "confirm", state)
+        self._button_cache = {}
         
         # Selection constraints from event data
         self.min_selections = self.event_data.ui_config.get("min_selections", 1) if hasattr(self.event_data, 'ui_config') else 1
         self.max_selections = self.event_data.ui_config.get("max_selections", 1) if hasattr(self.event_data, 'ui_config') else 1
         
-    def draw(self, screen):
-        """
-        Draw the event modal to the screen.
+        # Static layout: text surfaces, choice_buttons and confirm_button
+        self._build_layout()
         
-        Args:
-            screen: Pygame surface to draw on.
+    def _build_layout(self):
         """
-        # Draw modal background
-        pygame.draw.rect(screen, constants.COLOR_PANEL_BG, self.rect)
-        pygame.draw.rect(screen, constants.COLOR_TEXT, self.rect, 2)  # Border
+        Compute text surfaces and button rects once.
         
-        # Draw event title
-        title_surface = self.font_title.render(self.event_data.title, True, constants.COLOR_TEXT)
-        title_rect = title_surface.get_rect(centerx=self.rect.centerx, y=self.rect.y + 20)
-        screen.blit(title_surface, title_rect)
+        Everything here derives from self.rect and self.event_data, which are
+        fixed for the modal's lifetime; draw() only picks state colors.
+        """
+        # Event title
+        self._title_surface = render_text(self.font_title, self.event_data.title, constants.COLOR_TEXT)
+        self._title_rect = self._title_surface.get_rect(centerx=self.rect.centerx, y=self.rect.y + 20)
         
-        # Draw event description (with word wrapping)
+        # Event description (with word wrapping)
+        self._description = []  # List of (surface, rect) per wrapped line
         description_lines = self._wrap_text(self.event_data.description, self.rect.width - 40)
         y_offset = self.rect.y + 60
         
         for line in description_lines:
-            text_surface = self.font_text.render(line, True, constants.COLOR_TEXT)
+            text_surface = render_text(self.font_text, line, constants.COLOR_TEXT)
             text_rect = text_surface.get_rect(centerx=self.rect.centerx, y=y_offset)
-            screen.blit(text_surface, text_rect)
+            self._description.append((text_surface, text_rect))
             y_offset += 30
         
-        # Draw choice buttons
-        self.choice_buttons = []  # Reset button list
+        # Choice buttons
+        self.choice_buttons = []
+        self._choice_labels = []  # List of (label, selected label, label rect), parallel to choice_buttons
         button_width = self.rect.width - 80
         button_height = 35
         button_x = self.rect.x + 40
         y_offset += 20  # Space after description
         
+        # Buttons form a uniform vertical stack, so hit tests are arithmetic
+        self._choice_top = y_offset
+        self._choice_height = button_height
+        self._choice_stride = button_height + 10
+        
         for i, choice in enumerate(self.event_data.choices):
             # Handle both old string format and new dict format
             if isinstance(choice, str):
@@ -74,52 +93,133 @@ class EventModal:
             
             button_rect = pygame.Rect(button_x, y_offset, button_width, button_height)
             
-            # Choose color based on selection and hover state
-            is_selected = i in self.selected_choices
-            is_hovered = i == self.hovered_choice
-            
-            if is_selected:
-                bg_color = constants.COLOR_ACCENT
-                text_color = constants.COLOR_BG
-            elif is_hovered:
-                bg_color = constants.COLOR_BTN_HOVER
-                text_color = constants.COLOR_TEXT
-            else:
-                bg_color = constants.COLOR_BTN_IDLE
-                text_color = constants.COLOR_TEXT
-            
-            pygame.draw.rect(screen, bg_color, button_rect, border_radius=4)
-            pygame.draw.rect(screen, constants.COLOR_BORDER, button_rect, 1, border_radius=4)
-            
-            choice_surface = self.font_text.render(choice_text, True, text_color)
-            choice_rect = choice_surface.get_rect(center=button_rect.center)
-            screen.blit(choice_surface, choice_rect)
+            # Idle and hovered buttons share a text color; selected ones invert it
+            label = render_text(self.font_text, choice_text, constants.COLOR_TEXT)
+            selected_label = render_text(self.font_text, choice_text, constants.COLOR_BG)
+            label_rect = label.get_rect(center=button_rect.center)
             
             self.choice_buttons.append((button_rect, choice, i))
+            self._choice_labels.append((label, selected_label, label_rect))
             y_offset += button_height + 10
         
-        # Draw confirm button at bottom
+        # Bounding box of the whole stack; positions outside it (most of the
+        # modal, and everything past it) are rejected with one C-level check
+        stack_height = max(0, y_offset - 10 - self._choice_top)
+        self._choice_area = pygame.Rect(button_x, self._choice_top, button_width, stack_height)
+        
+        # Confirm button at bottom
         confirm_width = 120
         confirm_height = 40
         confirm_x = self.rect.centerx - confirm_width // 2
         confirm_y = self.rect.bottom - confirm_height - 20
         self.confirm_button = pygame.Rect(confirm_x, confirm_y, confirm_width, confirm_height)
         
+        self._confirm_label = render_text(self.font_text, "Confirm", constants.COLOR_TEXT)
+        self._confirm_label_dim = render_text(self.font_text, "Confirm", constants.COLOR_TEXT_DIM)
+        self._confirm_label_rect = self._confirm_label.get_rect(center=self.confirm_button.center)
+        
+        self._base_surface = self._compose_base()
+    
+    def _compose_base(self):
+        """
+        Pre-render the parts of the modal that never change.
+        
+        Background, border, title, description and every idle choice button
+        that lies inside the modal rect go onto one surface, so a frame is one
+        blit plus the buttons whose state differs from idle. Buttons that spill
+        past the modal (long choice lists) are left out and drawn per frame,
+        since the area around them must stay transparent.
+        """
+        base = pygame.Surface(self.rect.size).convert()
+        origin = (-self.rect.x, -self.rect.y)
+        
+        pygame.draw.rect(base, constants.COLOR_PANEL_BG, base.get_rect())
+        pygame.draw.rect(base, constants.COLOR_TEXT, base.get_rect(), 2)  # Border
+        
+        base.blit(self._title_surface, self._title_rect.move(origin))
+        for text_surface, text_rect in self._description:
+            base.blit(text_surface, text_rect.move(origin))
+        
+        self._baked_choices = set()
+        for (button_rect, _choice, i), (label, _selected_label, label_rect) in zip(self.choice_buttons, self._choice_labels):
+            if self.rect.contains(button_rect):
+                self._draw_button(base, constants.COLOR_BTN_IDLE, button_rect.move(origin), label, label_rect.move(origin))
+                self._baked_choices.add(i)
+        
+        return base
+    
+    @staticmethod
+    def _draw_button(surface, bg_color, button_rect, label, label_rect):
+        """Draw a rounded, bordered button with its label."""
+        pygame.draw.rect(surface, bg_color, button_rect, border_radius=4)
+        pygame.draw.rect(surface, constants.COLOR_BORDER, button_rect, 1, border_radius=4)
+        surface.blit(label, label_rect)
+    
+    def _blit_button(self, screen, key, bg_color, button_rect, label, label_rect):
+        """
+        Blit a button from a surface rasterized on first use.
+        
+        The rounded fill, border and label are drawn once per (button, state)
+        onto a transparent surface, so redrawing a hovered or selected button
+        is a single blit. A label wider than its button is drawn directly,
+        since the surface would clip it.
+        """
+        if not button_rect.contains(label_rect):
+            self._draw_button(screen, bg_color, button_rect, label, label_rect)
+            return
+        
+        surface = self._button_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface(button_rect.size, pygame.SRCALPHA).convert_alpha()
+            self._draw_button(surface, bg_color, surface.get_rect(), label,
+                              label_rect.move(-button_rect.x, -button_rect.y))
+            self._button_cache[key] = surface
+        screen.blit(surface, button_rect)
+    
+    def draw(self, screen):
+        """
+        Draw the event modal to the screen.
+        
+        Args:
+            screen: Pygame surface to draw on.
+        """
+        # Background, border, title, description and idle buttons
+        screen.blit(self._base_surface, self.rect)
+        
+        # Draw choice buttons that differ from the pre-rendered idle state
+        # (per-button lookups bound once; the IGCSE list has ~20 buttons)
+        selected = self.selected_choices
+        hovered = self.hovered_choice
+        baked = self._baked_choices
+        blit_button = self._blit_button
+        color_accent = constants.COLOR_ACCENT
+        color_hover = constants.COLOR_BTN_HOVER
+        color_idle = constants.COLOR_BTN_IDLE
+        for (button_rect, _choice, i), (label, selected_label, label_rect) in zip(self.choice_buttons, self._choice_labels):
+            # Choose color based on selection and hover state
+            if i in selected:
+                bg_color = color_accent
+                label = selected_label
+            elif i == hovered:
+                bg_color = color_hover
+            elif i in baked:
+                continue
+            else:
+                bg_color = color_idle
+            
+            blit_button(screen, (i, bg_color), bg_color, button_rect, label, label_rect)
+        
         # Enable confirm only if selection count is within bounds
         selection_count = len(self.selected_choices)
         if self.min_selections <= selection_count <= self.max_selections:
             confirm_color = constants.COLOR_LOG_POSITIVE
-            confirm_text_color = constants.COLOR_TEXT
+            confirm_label = self._confirm_label
         else:
             confirm_color = constants.COLOR_TEXT_DIM
-            confirm_text_color = constants.COLOR_TEXT_DIM
-        
-        pygame.draw.rect(screen, confirm_color, self.confirm_button, border_radius=4)
-        pygame.draw.rect(screen, constants.COLOR_BORDER, self.confirm_button, 1, border_radius=4)
+            confirm_label = self._confirm_label_dim
         
-        confirm_surface = self.font_text.render("Confirm", True, confirm_text_color)
-        confirm_rect = confirm_surface.get_rect(center=self.confirm_button.center)
-        screen.blit(confirm_surface, confirm_rect)
+        self._blit_button(screen, ("confirm", confirm_color), confirm_color,
+                          self.confirm_button, confirm_label, self._confirm_label_rect)
     
     def handle_event(self, event):
         """
@@ -133,31 +233,25 @@ class EventModal:
         """
         if event.type == pygame.MOUSEMOTION:
             # Update hover state
-            mouse_pos = event.pos
-            self.hovered_choice = None
-            
-            for button_rect, choice_data, choice_index in self.choice_buttons:
-                if button_rect.collidepoint(mouse_pos):
-                    self.hovered_choice = choice_index
-                    break
+            self.hovered_choice = self._choice_at(event.pos)
                     
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
             mouse_pos = event.pos
             
             # Check choice buttons
-            for button_rect, choice_data, choice_index in self.choice_buttons:
-                if button_rect.collidepoint(mouse_pos):
-                    # Toggle selection for multi-select, or single select
-                    if choice_index in self.selected_choices:
-                        self.selected_choices.remove(choice_index)
-                    else:
-                        # For single select, clear previous selection
-                        if self.max_selections == 1:
-                            self.selected_choices.clear()
-                        # Add new selection if under max limit
-                        if len(self.selected_choices) < self.max_selections:
-                            self.selected_choices.append(choice_index)
-                    return None  # Handled, but no action yet
+            choice_index = self._choice_at(mouse_pos)
+            if choice_index is not None:
+                # Toggle selection for multi-select, or single select
+                if choice_index in self.selected_choices:
+                    del self.selected_choices[choice_index]
+                else:
+                    # For single select, clear previous selection
+                    if self.max_selections == 1:
+                        self.selected_choices.clear()
+                    # Add new selection if under max limit
+                    if len(self.selected_choices) < self.max_selections:
+                        self.selected_choices[choice_index] = None
+                return None  # Handled, but no action yet
             
             # Check confirm button (only if selection is valid)
             selection_count = len(self.selected_choices)
@@ -166,6 +260,21 @@ class EventModal:
         
         return None  # Event not handled
             
+    def _choice_at(self, pos):
+        """
+        Find the choice button under a screen position.
+        
+        Args:
+            pos: (x, y) screen position.
+            
+        Returns:
+            Index of the choice under pos, or None (gaps between buttons miss).
+        """
+        if not self._choice_area.collidepoint(pos):
+            return None
+        index, within = divmod(pos[1] - self._choice_top, self._choice_stride)
+        return index if within < self._choice_height else None
+    
     def _wrap_text(self, text: str, max_width: int) -> list:
         """
         Wrap text to fit within the specified width.
@@ -177,24 +286,27 @@ class EventModal:
         Returns:
             List of wrapped text lines.
         """
+        # font.size() measures without rasterizing. Whole candidate lines are
+        # measured (not summed word widths) because kerning across the spaces
+        # makes the two differ.
+        measure = self.font_text.size
         words = text.split(' ')
         lines = []
-        current_line = []
+        current_line = None  # None until a word starts the line
         
         for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surface = self.font_text.render(test_line, True, constants.COLOR_TEXT)
+            test_line = word if current_line is None else f"{current_line} {word}"
             
-            if test_surface.get_width() <= max_width:
-                current_line.append(word)
+            if measure(test_line)[0] <= max_width:
+                current_line = test_line
             else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
+                if current_line is not None:
+                    lines.append(current_line)
+                    current_line = word
                 else:
                     lines.append(word)
                     
-        if current_line:
-            lines.append(' '.join(current_line))
+        if current_line is not None:
+            lines.append(current_line)
             
         return lines
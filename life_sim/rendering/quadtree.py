@@ -0,0 +1,123 @@
+# life_sim/rendering/quadtree.py
+"""
+Barnes-Hut Quadtree Module.
+Approximates the all-pairs repulsion of the Social Graph in O(N log N).
+"""
+import numpy as np
+
+
+class QuadCell:
+    """A square region of the tree holding aggregate mass for its nodes."""
+    __slots__ = ("x", "y", "size", "mass", "com", "children", "indices")
+
+    def __init__(self, x, y, size):
+        self.x = x          # Left edge
+        self.y = y          # Top edge
+        self.size = size    # Side length
+        self.mass = 0
+        self.com = None     # Center of mass, shape (2,)
+        self.children = []  # Non-empty child cells
+        self.indices = None # Node indices (leaves only)
+
+
+def build_quadtree(pos, leaf_size=8, max_depth=16):
+    """
+    Builds a quadtree over node positions.
+
+    Args:
+        pos: (N, 2) array of node positions.
+        leaf_size: Maximum nodes stored in a leaf before it is split.
+        max_depth: Hard recursion limit (guards against coincident nodes).
+
+    Returns:
+        QuadCell: The root cell, or None if pos is empty.
+    """
+    if len(pos) == 0:
+        return None
+
+    lo = pos.min(axis=0)
+    hi = pos.max(axis=0)
+    size = max(float(np.max(hi - lo)), 1.0)
+    root = QuadCell(float(lo[0]), float(lo[1]), size)
+    _fill(root, pos, np.arange(len(pos)), leaf_size, max_depth)
+    return root
+
+
+def _fill(cell, pos, indices, leaf_size, depth):
+    """Recursively assigns indices to cell and its quadrants."""
+    cell.mass = len(indices)
+    cell.com = pos[indices].mean(axis=0)
+
+    if len(indices) <= leaf_size or depth == 0:
+        cell.indices = indices
+        return
+
+    half = cell.size / 2
+    mid_x = cell.x + half
+    mid_y = cell.y + half
+    right = pos[indices, 0] >= mid_x
+    bottom = pos[indices, 1] >= mid_y
+
+    for is_right, is_bottom in ((False, False), (True, False), (False, True), (True, True)):
+        mask = (right == is_right) & (bottom == is_bottom)
+        if not mask.any():
+            continue
+        child = QuadCell(mid_x if is_right else cell.x, mid_y if is_bottom else cell.y, half)
+        _fill(child, pos, indices[mask], leaf_size, depth - 1)
+        cell.children.append(child)
+
+
+def repulsion_forces(pos, strength, theta=1.2, leaf_size=8):
+    """
+    Barnes-Hut approximation of the Social Graph repulsion.
+
+    Matches the exact kernel F_i = sum_j k * (p_i - p_j) / max(d^2, 1):
+    a cell that is far enough away (size / distance < theta) acts as a
+    single body of its total mass at its center of mass.
+
+    The tree is walked once for all nodes together: each cell receives the
+    batch of node indices that still need it, so per-cell work is vectorized.
+
+    Args:
+        pos: (N, 2) array of node positions.
+        strength: Repulsion constant k.
+        theta: Opening angle. 0 reproduces the exact all-pairs result.
+        leaf_size: Maximum nodes per leaf.
+
+    Returns:
+        np.ndarray: (N, 2) array of repulsion forces.
+    """
+    forces = np.zeros_like(pos, dtype=np.float64)
+    root = build_quadtree(pos, leaf_size=leaf_size)
+    if root is None:
+        return forces
+
+    stack = [(root, np.arange(len(pos)))]
+    while stack:
+        cell, active = stack.pop()
+        p = pos[active]
+
+        if cell.indices is not None:
+            # Leaf: exact interaction (self-pairs have zero delta)
+            diff = p[:, np.newaxis, :] - pos[cell.indices][np.newaxis, :, :]
+            dist_sq = np.einsum('ijk,ijk->ij', diff, diff)
+            np.maximum(dist_sq, 1.0, out=dist_sq)
+            forces[active] += strength * np.einsum('ijk,ij->ik', diff, 1.0 / dist_sq)
+            continue
+
+        delta = p - cell.com
+        dist_sq = np.einsum('ij,ij->i', delta, delta)
+        inside = ((p[:, 0] >= cell.x) & (p[:, 0] <= cell.x + cell.size) &
+                  (p[:, 1] >= cell.y) & (p[:, 1] <= cell.y + cell.size))
+        far = ~inside & (cell.size * cell.size < theta * theta * dist_sq)
+
+        if far.any():
+            scale = strength * cell.mass / np.maximum(dist_sq[far], 1.0)
+            forces[active[far]] += delta[far] * scale[:, np.newaxis]
+
+        near = active[~far]
+        if len(near):
+            for child in cell.children:
+                stack.append((child, near))
+
+    return forces
@@ -6,17 +6,81 @@ Handles all drawing operations and UI rendering.
 import pygame
 import logging
 import os
+import numpy as np
+from collections import OrderedDict
+from operator import itemgetter
 from .. import constants
-from .ui import Button, LogPanel, APBar, NumberStepper, RelationshipPanel
+from .ui import Button, LogPanel, APBar, NumberStepper, RelationshipPanel, render_text
 from .family_tree import FamilyTreeLayout
 from .social_graph import SocialGraphLayout
 from .modals import EventModal
 from .background import BackgroundManager
 
+# Hit zones are tuples whose first item is their Rect
+_zone_rect = itemgetter(0)
+
+# Transparent color for composed widget surfaces (appears in no UI palette)
+_COLORKEY = (255, 0, 255)
+
+# Entries kept by the tooltip word-wrap cache
+_WRAP_CACHE_MAX = 256
+
+# Family tree layouts kept for switching back to recently viewed agents
+_FT_LAYOUT_CACHE_MAX = 4
+
+# Attributes modal schedule, built once instead of per frame
+_VITALS_ATTRS = ("Health", "Happiness", "Energy", "Fertility", "Libido", "Looks", "Money")
+_PHYSICAL_ATTRS = ("Fitness", "Strength", "Agility", "Balance", "Coordination", "Reaction Time", "Flexibility", "Speed", "Power")
+_COGNITIVE_ATTRS = ("IQ",) + constants.APTITUDES
+_DEFAULT_TEMPERAMENT_ATTRS = tuple(t.replace("_", " ") for t in constants.TEMPERAMENT_TRAITS)
+_MIND_SECTIONS = (
+    ("Openness", "trait"),
+    ("Conscientiousness", "trait"),
+    ("Extraversion", "trait"),
+    ("Agreeableness", "trait"),
+    ("Neuroticism", "trait"),
+    ("Cognitive Profile", "cognitive"),
+)
+
+# Academics grade colors indexed by grade (0-100; clamp first)
+_GRADE_COLORS = tuple(
+    constants.COLOR_LOG_POSITIVE if grade >= 90 else  # Green
+    constants.COLOR_LOG_HEADER if grade >= 70 else    # Blue
+    (255, 255, 100) if grade >= 50 else               # Yellow
+    constants.COLOR_LOG_NEGATIVE                      # Red
+    for grade in range(101)
+)
+
+# Player conditions that gate action buttons, as bit flags
+_UI_WORKING_AGE = 1  # Old enough to look for a job
+_UI_EMPLOYED = 2
+_UI_ENROLLED = 4
+_UI_IN_SESSION = 8   # Enrolled and the school year is running
+
+def _player_ui_flags(player):
+    """Bitmask of the _UI_* conditions the player currently meets."""
+    flags = 0
+    if player.age >= 16:
+        flags |= _UI_WORKING_AGE
+    if player.job is not None:
+        flags |= _UI_EMPLOYED
+    if player.school is not None:
+        flags |= _UI_ENROLLED
+        if player.school.get("is_in_session", False):
+            flags |= _UI_IN_SESSION
+    return flags
+
 class Renderer:
     """
     Handles drawing the SimState to the screen using a 3-panel layout.
     """
+    # Every widget below reacts only to these; anything else (keys, window
+    # focus, text input, ...) is a no-op for the whole UI chain
+    HANDLED_EVENT_TYPES = frozenset((
+        pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL, pygame.VIDEORESIZE,
+    ))
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
@@ -33,6 +97,15 @@ class Renderer:
         self.font_header = pygame.font.SysFont("Arial", constants.FONT_SIZE_HEADER, bold=True)
         self.font_log = pygame.font.SysFont("Consolas", constants.FONT_SIZE_LOG)
         
+        # Widgets that _update_layout repositions once they exist
+        self.log_panel = None
+        self.relationship_panel = None
+        self.tabs = []    # List[Button] (Using Button class for tabs)
+        
+        # Social Graph State
+        self.viewing_social_graph = False
+        self.social_graph = SocialGraphLayout()
+        
         # Layout Calculation
         self._update_layout()
         
@@ -44,6 +117,8 @@ class Renderer:
             self.rect_center.height, 
             self.font_log
         )
+        # The center tint is already composited into the background
+        self.log_panel.draw_background = False
         
         # Initialize Relationship Panel (will be positioned in _draw_right_panel)
         self.relationship_panel = RelationshipPanel(
@@ -62,10 +137,9 @@ class Renderer:
         self.viewing_family_tree_agent = None 
         self.ft_layout = FamilyTreeLayout()
         self.ft_built_for_uid = None # Cache key to avoid rebuilding every frame
+        # Recently built layouts: uid -> ((year, month_index), layout), oldest first
+        self._ft_layout_cache = OrderedDict()
         
-        # Social Graph State
-        self.viewing_social_graph = False
-        self.social_graph = SocialGraphLayout()
         self.ft_offset_x = 0
         self.ft_offset_y = 0
         self.ft_is_dragging = False
@@ -74,10 +148,12 @@ class Renderer:
         self.ft_buttons = [] # List of (Rect, Agent) for the current frame
         
         self.buttons = {} # Dict[str, List[Button]]
-        self.tabs = []    # List[Button] (Using Button class for tabs)
+        self.visible_buttons = [] # Buttons of the active tab shown in the last drawn frame
         
         # Tooltip zones for clickable grade areas
         self.tooltip_zones = []  # List of (Rect, subject_name) tuples
+        # Academics rows as (key, blits, tooltip zones), see _draw_left_panel
+        self._academics_rows = None
         self.attribute_tooltip_zones = []  # List of (Rect, attr_name, value, max_value)
         self.academics_scroll_offset = 0
         self.academics_scroll_max = 0
@@ -85,14 +161,15 @@ class Renderer:
         
         self.active_tab = "Main"
         
-        # Visibility Logic (Action ID -> Lambda accepting player)
+        # Visibility Logic (Action ID -> _UI_* flags the player must all have)
+        # Buttons without an entry are always shown
         self.visibility_rules = {
-            "FIND_JOB": lambda player: player.age >= 16,
-            "WORK": lambda player: player.job is not None,
-            "SCHOOL_GRADES": lambda player: player.school is not None,
-            "SCHOOL_CLASSMATES": lambda player: player.school is not None,
-            "SCHOOL_STUDY": lambda player: player.school is not None and player.school.get("is_in_session", False),
-            "SCHOOL_SKIP": lambda player: player.school is not None and player.school.get("is_in_session", False)
+            "FIND_JOB": _UI_WORKING_AGE,
+            "WORK": _UI_EMPLOYED,
+            "SCHOOL_GRADES": _UI_ENROLLED,
+            "SCHOOL_CLASSMATES": _UI_ENROLLED,
+            "SCHOOL_STUDY": _UI_ENROLLED | _UI_IN_SESSION,
+            "SCHOOL_SKIP": _UI_ENROLLED | _UI_IN_SESSION
         }
         
         # Storage for interactive rects in the modal (recalculated every frame)
@@ -115,6 +192,16 @@ class Renderer:
                 self.logger.warning(f"Icon not found at {path}. Using text fallback.")
         except Exception as e:
             self.logger.error(f"Failed to load icon: {e}")
+        # Composed FT buttons (background, border, icon) keyed by button size
+        self._ft_button_cache = {}
+        # Rounded card backgrounds keyed by (size, fill, border, radius)
+        self._card_chrome_cache = {}
+        # Dashed rect borders keyed by (w, h, color, width, dash_len)
+        self._dashed_rect_cache = {}
+        # Wrapped tooltip lines keyed by (text, max_width), see _wrap_tooltip_text
+        self._wrap_cache = OrderedDict()
+        # Last composed tooltip box as ((lines, line_height), surface)
+        self._tooltip_box = None
 
         self._init_ui_structure()
         
@@ -134,12 +221,16 @@ class Renderer:
         
         # Initialize schedule controls after all layout is set up
         self._init_schedule_controls()
+        
+        # Inputs of the last fully drawn frame (see _frame_key); None forces a redraw
+        self._last_frame_key = None
 
     def _init_ui_structure(self):
         """Creates Tabs and Action Buttons."""
         # Clear existing UI elements before recreating
         self.tabs.clear()
         self.buttons.clear()
+        self.visible_buttons = []  # Repopulated by the next _draw_right_panel
         
         # 1. Init Tabs
         tab_names = ["Main", "School", "Social", "Assets"]
@@ -223,19 +314,6 @@ class Renderer:
             1.0, 0.0, 1.0, 0.1, self.font_main, "Attendance %"
         )
 
-    def _draw_panel_background(self, rect, alpha):
-        """
-        Draw a transparent panel background.
-        
-        Args:
-            rect: pygame.Rect defining the panel area
-            alpha: Alpha transparency value (0-255)
-        """
-        s = pygame.Surface((rect.width, rect.height))
-        s.set_alpha(alpha)
-        s.fill((20, 20, 20))  # Dark grey background
-        self.screen.blit(s, (rect.x, rect.y))
-
     def _update_layout(self):
         """Update panel layout based on current screen dimensions."""
         self.rect_left = pygame.Rect(0, 0, constants.PANEL_LEFT_WIDTH + constants.AP_BAR_WIDTH, self.screen_height)
@@ -253,21 +331,33 @@ class Renderer:
         center_w = self.screen_width - constants.PANEL_LEFT_WIDTH - constants.AP_BAR_WIDTH - constants.PANEL_RIGHT_WIDTH
         self.rect_center = pygame.Rect(constants.PANEL_LEFT_WIDTH + constants.AP_BAR_WIDTH, 0, center_w, self.screen_height)
         
+        # Fixed controls on the center-panel overlays, shared by drawing and hit-testing
+        self.rect_modal_close = pygame.Rect(self.rect_center.right - 30, self.rect_center.y + 10, 20, 20)
+        self.rect_sg_toggle_show = pygame.Rect(self.rect_center.x + 10, self.rect_center.y + 45, 120, 25)
+        self.rect_sg_toggle_links = pygame.Rect(self.rect_center.x + 140, self.rect_center.y + 45, 120, 25)
+        
+        # Transparent dark grey panel backgrounds, baked into the background by BackgroundManager
+        self.panel_tints = (
+            (tuple(self.rect_left), constants.COLOR_PANEL_TINT, constants.UI_OPACITY_PANEL),
+            (tuple(self.rect_center), constants.COLOR_PANEL_TINT, constants.UI_OPACITY_CENTER),
+            (tuple(self.rect_right), constants.COLOR_PANEL_TINT, constants.UI_OPACITY_PANEL),
+        )
+        
         # Update log panel if it exists
-        if hasattr(self, 'log_panel'):
+        if self.log_panel is not None:
             self.log_panel.update_position(self.rect_center.x, self.rect_center.y, self.rect_center.width, self.rect_center.height)
         
         # Update relationship panel if it exists
-        if hasattr(self, 'relationship_panel'):
+        if self.relationship_panel is not None:
             self.relationship_panel.update_position(self.rect_right.x, self.rect_right.y, self.rect_right.width, self.rect_right.height)
         
         # Rebuild UI structure with new dimensions
-        if hasattr(self, 'tabs') and self.tabs:
+        if self.tabs:
             self._init_ui_structure()
         
         # Rebuild social graph if it's currently visible and has been built
-        if hasattr(self, 'viewing_social_graph') and self.viewing_social_graph:
-            if hasattr(self, 'social_graph') and self.social_graph.bounds is not None:
+        if self.viewing_social_graph:
+            if self.social_graph.bounds is not None:
                 # We need sim_state to rebuild, but we don't have it here
                 # Mark for rebuild in next render cycle
                 self._social_graph_needs_rebuild = True
@@ -282,6 +372,15 @@ class Renderer:
         """
         Processes input events.
         """
+        if event.type not in self.HANDLED_EVENT_TYPES:
+            return None
+        
+        # Any input may change hover, selection or (via main.py) the sim state
+        self._last_frame_key = None
+        
+        # Most handlers below react to a left click; test for it once
+        left_click = event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+        
         # Attributes modal scrolling has priority while modal is open.
         if self.viewing_agent and not self.viewing_family_tree_agent and self.attr_modal_scroll_rect:
             if event.type == pygame.MOUSEWHEEL:
@@ -323,25 +422,27 @@ class Renderer:
             modal_result = self.event_modal.handle_event(event)
             if modal_result == "CONFIRM_EVENT":
                 # Return special action with selected choice data
-                return ("RESOLVE_EVENT", self.event_modal.selected_choices)
+                return ("RESOLVE_EVENT", list(self.event_modal.selected_choices))
             return None  # Block all other UI when event is pending
         
         # 0d. Check Grade Tooltip Zones (Left Panel)
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for rect, subject_name in self.tooltip_zones:
-                if rect.collidepoint(event.pos):
-                    # Show subject tooltip (handled in render method)
-                    return None
+        if left_click:
+            if self._zone_at(self.tooltip_zones, event.pos) is not None:
+                # Show subject tooltip (handled in render method)
+                return None
 
         # 0. Check Social Graph Modal (Top Priority)
         if self.viewing_social_graph:
             # 1. Toggle Buttons
             # Button A: Show All/Known
-            btn_a_rect = pygame.Rect(self.rect_center.x + 10, self.rect_center.y + 45, 120, 25)
+            btn_a_rect = self.rect_sg_toggle_show
             # Button B: Network On/Off
-            btn_b_rect = pygame.Rect(self.rect_center.x + 140, self.rect_center.y + 45, 120, 25)
+            btn_b_rect = self.rect_sg_toggle_links
             
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            # 2. Close Button
+            close_rect = self.rect_modal_close
+            
+            if left_click:
                 if btn_a_rect.collidepoint(event.pos):
                     self.social_graph.show_all = not self.social_graph.show_all
                     self.social_graph.build(sim_state, self.rect_center)
@@ -350,11 +451,7 @@ class Renderer:
                     self.social_graph.show_network = not self.social_graph.show_network
                     self.social_graph.build(sim_state, self.rect_center)
                     return None
-
-            # 2. Close Button
-            close_rect = pygame.Rect(self.rect_center.right - 30, self.rect_center.y + 10, 20, 20)
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if close_rect.collidepoint(event.pos):
+                elif close_rect.collidepoint(event.pos):
                     self.viewing_social_graph = False
                     return None
             
@@ -382,8 +479,8 @@ class Renderer:
         # 0a. Check Family Tree Modal (Top Priority)
         if self.viewing_family_tree_agent:
             # Close Button Logic
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                close_rect = pygame.Rect(self.rect_center.right - 30, self.rect_center.y + 10, 20, 20)
+            if left_click:
+                close_rect = self.rect_modal_close
                 if close_rect.collidepoint(event.pos):
                     self.viewing_family_tree_agent = None
                     self.ft_built_for_uid = None # Reset cache
@@ -442,9 +539,9 @@ class Renderer:
                     return None
 
         # 0b. Check Attributes Modal Interaction
-        if self.viewing_agent and not self.viewing_family_tree_agent and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if self.viewing_agent and not self.viewing_family_tree_agent and left_click:
             # Check Close Button
-            close_rect = pygame.Rect(self.rect_center.right - 30, self.rect_center.y + 10, 20, 20)
+            close_rect = self.rect_modal_close
             if close_rect.collidepoint(event.pos):
                 self.viewing_agent = None
                 self.attr_modal_scroll_offset = 0
@@ -454,30 +551,32 @@ class Renderer:
                 return None
 
             # Check category tabs
-            for rect, category in self.attr_modal_tab_zones:
-                if rect.collidepoint(event.pos):
-                    if self.attr_modal_active_category != category:
-                        self.attr_modal_active_category = category
-                        self.attr_modal_scroll_offset = 0
-                    return None
+            zone = self._zone_at(self.attr_modal_tab_zones, event.pos)
+            if zone is not None:
+                category = zone[1]
+                if self.attr_modal_active_category != category:
+                    self.attr_modal_active_category = category
+                    self.attr_modal_scroll_offset = 0
+                return None
             
             # Check Attribute Cards (Pinning)
             # Only allow pinning if viewing the Player
             if self.viewing_agent == sim_state.player:
-                for rect, attr_name in self.modal_click_zones:
-                    if rect.collidepoint(event.pos):
-                        if attr_name in sim_state.player.pinned_attributes:
-                            sim_state.player.pinned_attributes.remove(attr_name)
-                        else:
-                            sim_state.player.pinned_attributes.append(attr_name)
-                        return None # Consumed
+                zone = self._zone_at(self.modal_click_zones, event.pos)
+                if zone is not None:
+                    attr_name = zone[1]
+                    if attr_name in sim_state.player.pinned_attributes:
+                        sim_state.player.pinned_attributes.remove(attr_name)
+                    else:
+                        sim_state.player.pinned_attributes.append(attr_name)
+                    return None # Consumed
 
         # 0c. Check Family Tree Buttons (Global)
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for rect, agent in self.ft_buttons:
-                if rect.collidepoint(event.pos):
-                    self.viewing_family_tree_agent = agent
-                    return None
+        if left_click:
+            zone = self._zone_at(self.ft_buttons, event.pos)
+            if zone is not None:
+                self.viewing_family_tree_agent = zone[1]
+                return None
 
         # Pass to LogPanel (Scrolling + Clicking headers)
         if sim_state and not self.viewing_agent:
@@ -491,21 +590,16 @@ class Renderer:
                 return None # Consumed locally
         
         # 2. Check Buttons in Active Tab
-        if self.active_tab in self.buttons:
-            for btn in self.buttons[self.active_tab]:
-                # Check Visibility Rule
-                if sim_state:
-                    rule = self.visibility_rules.get(btn.action_id)
-                    if rule and not rule(sim_state.player):
-                        continue
-
-                action = btn.handle_event(event)
-                if action:
-                    if action == "SOCIAL_MAP":
-                        self.viewing_social_graph = True
-                        self.social_graph.build(sim_state, self.rect_center)
-                        return None
-                    return action
+        # Visibility was resolved when they were drawn, which is also where
+        # their positions come from, so clicks match what is on screen
+        for btn in self.visible_buttons:
+            action = btn.handle_event(event)
+            if action:
+                if action == "SOCIAL_MAP":
+                    self.viewing_social_graph = True
+                    self.social_graph.build(sim_state, self.rect_center)
+                    return None
+                return action
 
         # 2a. Check Schedule Button (Left Panel)
         if self.schedule_btn:
@@ -543,17 +637,30 @@ class Renderer:
 
     def render(self, sim_state):
         """Draws the full UI."""
+        # Keeps upcoming seasons prewarming and picks up background changes
+        # even on frames that are not redrawn
+        self.background_manager.update(sim_state, self.screen_width, self.screen_height)
+        
+        # Life-Sim is turn-based, so most frames repeat the previous one. The
+        # display surface still holds that frame (it is only drawn to here),
+        # so an idle frame just presents it again.
+        frame_key = self._frame_key(sim_state)
+        if frame_key is not None and frame_key == self._last_frame_key:
+            pygame.display.flip()
+            return
+        self._last_frame_key = frame_key
+        
         self.ft_buttons = [] # Reset interactive buttons for this frame
         self.tooltip_zones = []  # Reset tooltip zones for this frame
         self.attribute_tooltip_zones = []  # Reset attribute tooltip zones for this frame
         
-        # Physics Step
-        if self.viewing_social_graph:
+        # Physics Step (paused while an event modal covers the map; the modal
+        # also takes all input, so the frozen graph is never interacted with)
+        if self.viewing_social_graph and not sim_state.pending_event:
             self.social_graph.update_physics()
         
-        # Update and draw background
-        self.background_manager.update(sim_state, self.screen_width, self.screen_height)
-        self.background_manager.draw(self.screen)
+        # Draw background (updated above)
+        self.background_manager.draw(self.screen, self.panel_tints)
         
         # Update Log Panel Content
         self.log_panel.update_logs(sim_state.get_flat_log_for_rendering())
@@ -576,7 +683,10 @@ class Renderer:
         
         # Draw event modal on top of everything if active
         if sim_state.pending_event:
-            if self.event_modal is None:
+            # Built once per event (keyed on the event object, so an event
+            # replaced without an intermediate None frame still gets its own
+            # modal); its text and buttons are pre-rendered at construction
+            if self.event_modal is None or self.event_modal.event_data is not sim_state.pending_event:
                 # Create modal with centered rectangle
                 modal_width = 600
                 # Double height for IGCSE event to accommodate all subject choices
@@ -600,12 +710,40 @@ class Renderer:
         self._draw_attribute_tooltips(sim_state)
         
         # Draw relationship panel tooltips if on Social tab
-        if self.active_tab == "Social" and hasattr(self, 'relationship_panel'):
+        if self.active_tab == "Social" and self.relationship_panel is not None:
             mouse_pos = pygame.mouse.get_pos()
             self.relationship_panel.draw_tooltip(self.screen, mouse_pos, sim_state)
         
         pygame.display.flip()
 
+    def _frame_key(self, sim_state):
+        """
+        Summarize everything a frame depends on that can change without input.
+        
+        Input events clear the stored key in handle_event, which also covers
+        actions main.py applies in response. This key catches the rest: turns
+        processed and views switched programmatically, pointer position (hover
+        and tooltips) and window size.
+        
+        Returns:
+            Hashable key, or None if the frame must be redrawn regardless
+            (the social map animates its physics every frame it is not
+            paused behind an event).
+        """
+        if self.viewing_social_graph and not sim_state.pending_event:
+            return None
+        return (
+            sim_state.year,
+            sim_state.month_index,
+            sim_state.pending_event,
+            self.active_tab,
+            self.viewing_agent,
+            self.viewing_family_tree_agent,
+            self.background_manager.current_bg_name,
+            self.screen.get_size(),
+            pygame.mouse.get_pos(),
+        )
+
     def toggle_attributes(self, target=None):
         if target:
             self.viewing_agent = target
@@ -631,9 +769,6 @@ class Renderer:
             self.social_graph.build(sim_state, self.rect_center)
             self._social_graph_needs_rebuild = False
         
-        # Background
-        self._draw_panel_background(self.rect_center, constants.UI_OPACITY_CENTER)
-        
         # Clip to center panel
         old_clip = self.screen.get_clip()
         self.screen.set_clip(self.rect_center)
@@ -655,32 +790,34 @@ class Renderer:
         pygame.draw.rect(self.screen, (30, 30, 30), (self.rect_center.x, self.rect_center.y, self.rect_center.width, 40))
         pygame.draw.line(self.screen, constants.COLOR_BORDER, (self.rect_center.x, self.rect_center.y + 40), (self.rect_center.right, self.rect_center.y + 40))
         
-        title = self.font_header.render("Social Map", True, constants.COLOR_ACCENT)
-        self.screen.blit(title, (self.rect_center.x + 15, self.rect_center.y + 8))
+        # Header labels are collected and blitted in one call after the shapes;
+        # none of them overlaps another shape, so the order is free
+        labels = [(render_text(self.font_header, "Social Map", constants.COLOR_ACCENT),
+                   (self.rect_center.x + 15, self.rect_center.y + 8))]
 
         # Toggle Button A (Filter)
-        btn_a_rect = pygame.Rect(self.rect_center.x + 10, self.rect_center.y + 45, 120, 25)
+        btn_a_rect = self.rect_sg_toggle_show
         pygame.draw.rect(self.screen, constants.COLOR_BTN_IDLE, btn_a_rect, border_radius=4)
         pygame.draw.rect(self.screen, constants.COLOR_BORDER, btn_a_rect, 1, border_radius=4)
         
         txt_str = "Show: All" if self.social_graph.show_all else "Show: Known"
-        toggle_txt = self.font_log.render(txt_str, True, constants.COLOR_TEXT)
-        self.screen.blit(toggle_txt, (btn_a_rect.x + 10, btn_a_rect.y + 4))
+        labels.append((render_text(self.font_log, txt_str, constants.COLOR_TEXT), (btn_a_rect.x + 10, btn_a_rect.y + 4)))
 
         # Toggle Button B (Network)
-        btn_b_rect = pygame.Rect(self.rect_center.x + 140, self.rect_center.y + 45, 120, 25)
+        btn_b_rect = self.rect_sg_toggle_links
         pygame.draw.rect(self.screen, constants.COLOR_BTN_IDLE, btn_b_rect, border_radius=4)
         pygame.draw.rect(self.screen, constants.COLOR_BORDER, btn_b_rect, 1, border_radius=4)
         
         net_str = "Links: All" if self.social_graph.show_network else "Links: Direct"
-        net_txt = self.font_log.render(net_str, True, constants.COLOR_TEXT)
-        self.screen.blit(net_txt, (btn_b_rect.x + 10, btn_b_rect.y + 4))
+        labels.append((render_text(self.font_log, net_str, constants.COLOR_TEXT), (btn_b_rect.x + 10, btn_b_rect.y + 4)))
 
         # Close Button
-        close_rect = pygame.Rect(self.rect_center.right - 30, self.rect_center.y + 10, 20, 20)
+        close_rect = self.rect_modal_close
         pygame.draw.rect(self.screen, constants.COLOR_DEATH, close_rect, border_radius=3)
         pygame.draw.line(self.screen, constants.COLOR_TEXT, close_rect.topleft, close_rect.bottomright, 2)
         pygame.draw.line(self.screen, constants.COLOR_TEXT, close_rect.bottomleft, close_rect.topright, 2)
+        
+        self.screen.blits(labels, doreturn=False)
 
         # Tooltip
         info = self.social_graph.get_hover_info(sim_state)
@@ -720,21 +857,10 @@ class Renderer:
                     col = self.social_graph._get_relationship_color(info['rel_val'])
                     lines.append((rel_txt, col))
             
-            # Calculate Box Size
+            # Compose Box
             mx, my = pygame.mouse.get_pos()
-            line_height = 20
-            box_w = 0
-            box_h = len(lines) * line_height + 10
-            
-            surfaces = []
-            for text, color in lines:
-                s = self.font_log.render(text, True, color)
-                box_w = max(box_w, s.get_width())
-                surfaces.append(s)
-            
-            box_w += 20 # Padding
-            
-            # Draw Box
+            box = self._compose_tooltip_box(lines, 20)
+            box_w, box_h = box.get_size()
             bg_rect = pygame.Rect(mx + 15, my + 15, box_w, box_h)
             
             # Keep tooltip on screen
@@ -743,14 +869,7 @@ class Renderer:
             if bg_rect.bottom > self.screen.get_height():
                 bg_rect.y -= box_h + 30
                 
-            pygame.draw.rect(self.screen, (20, 20, 20), bg_rect)
-            pygame.draw.rect(self.screen, constants.COLOR_BORDER, bg_rect, 1)
-            
-            # Draw Text
-            curr_y = bg_rect.y + 5
-            for s in surfaces:
-                self.screen.blit(s, (bg_rect.x + 10, curr_y))
-                curr_y += line_height
+            self.screen.blit(box, bg_rect)
 
     def _draw_attributes_modal(self, sim_state):
         """Draws the detailed attributes overlay in the center panel."""
@@ -759,8 +878,6 @@ class Renderer:
         self.attribute_tooltip_zones = []
         self.attr_modal_tab_zones = []
         
-        # Draw background container.
-        self._draw_panel_background(self.rect_center, constants.UI_OPACITY_CENTER)
         pygame.draw.rect(self.screen, constants.COLOR_BORDER, self.rect_center, 1)
         
         agent = self.viewing_agent
@@ -771,14 +888,14 @@ class Renderer:
         pygame.draw.line(self.screen, constants.COLOR_BORDER, (header_rect.x, header_rect.bottom), (header_rect.right, header_rect.bottom))
 
         title_text = f"{agent.first_name}'s Attributes"
-        title_surf = self.font_header.render(title_text, True, constants.COLOR_ACCENT)
+        title_surf = render_text(self.font_header, title_text, constants.COLOR_ACCENT)
         self.screen.blit(title_surf, (self.rect_center.x + 18, self.rect_center.y + 12))
 
         hint = "Click cards to pin on dashboard" if is_player else "Inspect read-only profile"
-        hint_surf = self.font_log.render(hint, True, constants.COLOR_TEXT_DIM)
+        hint_surf = render_text(self.font_log, hint, constants.COLOR_TEXT_DIM)
         self.screen.blit(hint_surf, (self.rect_center.x + 20, header_rect.bottom + 8))
 
-        close_rect = pygame.Rect(self.rect_center.right - 30, self.rect_center.y + 10, 20, 20)
+        close_rect = self.rect_modal_close
         pygame.draw.rect(self.screen, constants.COLOR_DEATH, close_rect, border_radius=3)
         pygame.draw.line(self.screen, constants.COLOR_TEXT, close_rect.topleft, close_rect.bottomright, 2)
         pygame.draw.line(self.screen, constants.COLOR_TEXT, close_rect.bottomleft, close_rect.topright, 2)
@@ -801,7 +918,7 @@ class Renderer:
             f"{agent.eye_color} eyes, {agent.hair_color} hair",
         ]
         for chip in chips:
-            chip_surf = self.font_log.render(chip, True, constants.COLOR_TEXT)
+            chip_surf = render_text(self.font_log, chip, constants.COLOR_TEXT)
             chip_w = chip_surf.get_width() + 20
             if chip_x + chip_w > self.rect_center.right - 18:
                 chip_x = self.rect_center.x + 18
@@ -827,7 +944,7 @@ class Renderer:
         tabs_y = chip_y + chip_h + 12
         tab_x = self.rect_center.x + 18
         for category in categories:
-            tab_label = self.font_log.render(category, True, constants.COLOR_TEXT)
+            tab_label = render_text(self.font_log, category, constants.COLOR_TEXT)
             tab_w = max(116, tab_label.get_width() + 26)
             tab_rect = pygame.Rect(tab_x, tabs_y, tab_w, 28)
             is_active = (category == self.attr_modal_active_category)
@@ -861,35 +978,37 @@ class Renderer:
         row_gap = 8
         section_gap = 16
         bar_h = 6
+        # Progress bar track inside a card: (rect, color, radius) in card coordinates
+        bar_track = ((10, card_h - 12, col_w - 20, bar_h), (10, 10, 10), 2)
         col_y = [10, 10, 10]  # Raw content Y inside viewport.
 
         def col_x(col_idx):
             return content_rect.x + side_padding + (col_idx * (col_w + col_gap))
 
+        # Neuroticism facets read once per frame, not once per card
+        neuro_facets = agent.personality.get("Neuroticism", {}) if agent.personality else {}
+
+        # Bar colors indexed by band: 0 mid range, 1 top quarter, -1 bottom
+        # quarter. High is good except for Neuroticism, where it is bad.
+        bar_palette = (cat_accent, constants.COLOR_LOG_POSITIVE, constants.COLOR_LOG_NEGATIVE)
+        neuro_bar_palette = (cat_accent, constants.COLOR_LOG_NEGATIVE, constants.COLOR_LOG_POSITIVE)
+
         def _bar_color(name, value, max_val):
-            bar_col = cat_accent
-            is_neuro = (name == "Neuroticism" or (agent.personality and name in agent.personality.get("Neuroticism", {})))
             if max_val <= 0:
-                return bar_col
-            if is_neuro:
-                if value > (max_val * 0.75):
-                    return constants.COLOR_LOG_NEGATIVE
-                if value < (max_val * 0.25):
-                    return constants.COLOR_LOG_POSITIVE
-                return bar_col
-            if value < (max_val * 0.25):
-                return constants.COLOR_LOG_NEGATIVE
-            if value > (max_val * 0.75):
-                return constants.COLOR_LOG_POSITIVE
-            return bar_col
+                return cat_accent
+            # The bands cannot overlap since max_val > 0
+            band = (value > (max_val * 0.75)) - (value < (max_val * 0.25))
+            if name == "Neuroticism" or name in neuro_facets:
+                return neuro_bar_palette[band]
+            return bar_palette[band]
 
         def draw_section_header(col_idx, title):
             raw_y = col_y[col_idx]
             rect = pygame.Rect(col_x(col_idx), content_rect.y + raw_y - self.attr_modal_scroll_offset, col_w, 22)
             if rect.colliderect(content_rect):
-                pygame.draw.rect(self.screen, (26, 26, 26), rect, border_radius=5)
+                self.screen.blit(self._card_chrome(rect.size, (26, 26, 26), None, 5), rect)
                 pygame.draw.line(self.screen, cat_accent, (rect.x + 8, rect.bottom - 2), (rect.right - 8, rect.bottom - 2), 2)
-                txt = self.font_log.render(title, True, constants.COLOR_TEXT_DIM)
+                txt = render_text(self.font_log, title, constants.COLOR_TEXT_DIM)
                 self.screen.blit(txt, (rect.x + 8, rect.y + 2))
             col_y[col_idx] += 28
 
@@ -901,18 +1020,18 @@ class Renderer:
             border = constants.COLOR_BORDER if not is_pinned else cat_accent
 
             if rect.colliderect(content_rect):
-                pygame.draw.rect(self.screen, card_bg, rect, border_radius=6)
-                pygame.draw.rect(self.screen, border, rect, 1, border_radius=6)
+                # The bar track is part of the cached card background
+                has_bar = show_bar and max_val > 0
+                self.screen.blit(self._card_chrome(rect.size, card_bg, border, 6,
+                                                   bar_track if has_bar else None), rect)
 
                 value_text = str(int(value)) if isinstance(value, (int, float)) else str(value)
-                name_surf = self.font_log.render(name, True, constants.COLOR_TEXT)
-                val_surf = self.font_main.render(value_text, True, cat_accent)
+                name_surf = render_text(self.font_log, name, constants.COLOR_TEXT)
+                val_surf = render_text(self.font_main, value_text, cat_accent)
                 self.screen.blit(name_surf, (rect.x + 10, rect.y + 6))
                 self.screen.blit(val_surf, (rect.right - val_surf.get_width() - 10, rect.y + 4))
 
-                if show_bar and max_val > 0:
-                    bar_bg = pygame.Rect(rect.x + 10, rect.bottom - 12, rect.width - 20, bar_h)
-                    pygame.draw.rect(self.screen, (10, 10, 10), bar_bg, border_radius=2)
+                if has_bar:
                     pct = max(0.0, min(1.0, float(value) / float(max_val)))
                     fill_w = max(1, int((rect.width - 20) * pct))
                     bar_fill = pygame.Rect(rect.x + 10, rect.bottom - 12, fill_w, bar_h)
@@ -946,37 +1065,32 @@ class Renderer:
         self.screen.set_clip(content_rect)
 
         if self.attr_modal_active_category == "Overview":
-            draw_attr_list(0, "Vitals", ["Health", "Happiness", "Energy", "Fertility", "Libido", "Looks", "Money"])
-            draw_attr_list(1, "Physical", ["Fitness", "Strength", "Agility", "Balance", "Coordination", "Reaction Time", "Flexibility", "Speed", "Power"])
+            draw_attr_list(0, "Vitals", _VITALS_ATTRS)
+            draw_attr_list(1, "Physical", _PHYSICAL_ATTRS)
         elif self.attr_modal_active_category == "Mind":
             # Mind page:
             # Adults -> 3-column x 2-row sections (5 Big Five traits + Cognitive Profile).
             # Infants -> cognitive profile + temperament.
             if agent.age >= 3 and getattr(agent, "personality", None):
-                section_order = [
-                    ("Openness", "trait"),
-                    ("Conscientiousness", "trait"),
-                    ("Extraversion", "trait"),
-                    ("Agreeableness", "trait"),
-                    ("Neuroticism", "trait"),
-                    ("Cognitive Profile", "cognitive"),
-                ]
-                for idx, (title, kind) in enumerate(section_order):
+                for idx, (title, kind) in enumerate(_MIND_SECTIONS):
                     col_idx = idx % 3
                     draw_section_header(col_idx, title)
                     if kind == "trait":
-                        if title in agent.personality:
+                        facets = agent.personality.get(title)
+                        if facets is not None:
                             draw_attr_card(col_idx, title, agent.get_personality_sum(title), max_val=120, show_bar=True)
-                            for facet in agent.personality.get(title, {}).keys():
-                                draw_attr_card(col_idx, facet, agent.get_attr_value(facet), max_val=20, show_bar=True)
+                            # Facet values straight from the dict being walked; the same
+                            # values get_attr_value() finds after ~40 other name checks
+                            for facet, facet_value in facets.items():
+                                draw_attr_card(col_idx, facet, facet_value, max_val=20, show_bar=True)
                     else:
-                        for attr in ["IQ"] + list(constants.APTITUDES):
+                        for attr in _COGNITIVE_ATTRS:
                             val = agent.get_attr_value(attr)
                             draw_attr_card(col_idx, attr, val, max_val=constants.APTITUDE_MAX, show_bar=True)
                     col_y[col_idx] += section_gap
             else:
-                draw_attr_list(0, "Cognitive Profile", ["IQ"] + list(constants.APTITUDES), default_max=constants.APTITUDE_MAX)
-                temp_traits = list(agent.temperament.keys()) if getattr(agent, "temperament", None) else [t.replace("_", " ") for t in constants.TEMPERAMENT_TRAITS]
+                draw_attr_list(0, "Cognitive Profile", _COGNITIVE_ATTRS, default_max=constants.APTITUDE_MAX)
+                temp_traits = agent.temperament if getattr(agent, "temperament", None) else _DEFAULT_TEMPERAMENT_ATTRS
                 draw_attr_list(1, "Temperament", temp_traits, default_max=100)
 
         self.screen.set_clip(old_clip)
@@ -998,8 +1112,61 @@ class Renderer:
             thumb = pygame.Rect(track.x, thumb_y, track.width, thumb_h)
             pygame.draw.rect(self.screen, cat_accent, thumb, border_radius=2)
 
+    def _card_chrome(self, size, fill, border, radius, inset=None):
+        """
+        Rounded card background (and optional 1px border), rasterized once.
+        
+        Every card of a modal shares a size and a few color variants, so the
+        rounded rects are drawn once per variant and blitted afterwards. The
+        surface is opaque with colorkeyed corners, the same as drawing on the
+        screen since rounded rects are not anti-aliased.
+        
+        Args:
+            size: (width, height) of the card.
+            fill: Background color.
+            border: Border color, or None for no border.
+            radius: Corner radius.
+            inset: Optional (rect, color, radius) of a rounded rect drawn
+                inside the card, such as a progress bar track.
+            
+        Returns:
+            The card surface.
+        """
+        key = (size, fill, border, radius, inset)
+        chrome = self._card_chrome_cache.get(key)
+        if chrome is None:
+            chrome = pygame.Surface(size).convert()
+            chrome.fill(_COLORKEY)
+            chrome.set_colorkey(_COLORKEY)
+            card = chrome.get_rect()
+            pygame.draw.rect(chrome, fill, card, border_radius=radius)
+            if border is not None:
+                pygame.draw.rect(chrome, border, card, 1, border_radius=radius)
+            if inset is not None:
+                inset_rect, inset_color, inset_radius = inset
+                pygame.draw.rect(chrome, inset_color, inset_rect, border_radius=inset_radius)
+            self._card_chrome_cache[key] = chrome
+        return chrome
+
     def _draw_dashed_rect(self, surface, color, rect, width=2, dash_len=5):
         """Helper to draw a dashed rectangle."""
+        # In-law nodes share a size, so the dashes are drawn once per
+        # (size, color, width, dash_len) and blitted. The surface is padded
+        # by the line width because thick lines reach past the rect, and its
+        # background is colorkeyed (lines are not anti-aliased).
+        key = (rect[2], rect[3], color, width, dash_len)
+        dashed = self._dashed_rect_cache.get(key)
+        if dashed is None:
+            dashed = pygame.Surface((rect[2] + 2 * width, rect[3] + 2 * width)).convert()
+            dashed.fill(_COLORKEY)
+            dashed.set_colorkey(_COLORKEY)
+            self._draw_dashes(dashed, color, (width, width, rect[2], rect[3]), width, dash_len)
+            self._dashed_rect_cache[key] = dashed
+        surface.blit(dashed, (rect[0] - width, rect[1] - width))
+
+    @staticmethod
+    def _draw_dashes(surface, color, rect, width, dash_len):
+        """Draw the dash segments of a dashed rectangle, one line per dash."""
         x, y, w, h = rect
         
         # Top Edge
@@ -1027,17 +1194,26 @@ class Renderer:
         # 1. Build Layout if needed
         agent = self.viewing_family_tree_agent
         if self.ft_built_for_uid != agent.uid:
-            # Construct lookup of all agents
-            all_agents = {**sim_state.npcs, sim_state.player.uid: sim_state.player}
-            self.ft_layout.build(agent, all_agents)
+            # Family links and ages only change when a turn is processed, so a
+            # layout built for this agent earlier in the same month is reused
+            stamp = (sim_state.year, sim_state.month_index)
+            cached = self._ft_layout_cache.get(agent.uid)
+            if cached is not None and cached[0] == stamp:
+                self.ft_layout = cached[1]
+                self._ft_layout_cache.move_to_end(agent.uid)
+            else:
+                # Construct lookup of all agents
+                all_agents = {**sim_state.npcs, sim_state.player.uid: sim_state.player}
+                self.ft_layout = FamilyTreeLayout()
+                self.ft_layout.build(agent, all_agents)
+                self._ft_layout_cache[agent.uid] = (stamp, self.ft_layout)
+                if len(self._ft_layout_cache) > _FT_LAYOUT_CACHE_MAX:
+                    self._ft_layout_cache.popitem(last=False)
             self.ft_built_for_uid = agent.uid
             # Center the view
             self.ft_offset_x = 0
             self.ft_offset_y = 0
 
-        # 2. Draw Background
-        self._draw_panel_background(self.rect_center, constants.UI_OPACITY_CENTER)
-        
         # 3. Setup Clipping
         old_clip = self.screen.get_clip()
         self.screen.set_clip(self.rect_center)
@@ -1045,74 +1221,60 @@ class Renderer:
         cx = self.rect_center.centerx
         cy = self.rect_center.centery
         
+        # Bind per-item constants once; the loops below run for every edge/node
+        color_text_dim = constants.COLOR_TEXT_DIM
+        color_panel_bg = constants.COLOR_PANEL_BG
+        color_border = constants.COLOR_BORDER
+        color_text = constants.COLOR_TEXT
+        ox = cx + self.ft_offset_x
+        oy = cy + self.ft_offset_y
+        
         # 4. Draw Edges (Orthogonal Routing)
-        for start_node, end_node, link_type in self.ft_layout.edges:
-            # Calculate Screen Coords
-            x1 = cx + start_node.x + self.ft_offset_x
-            y1 = cy + start_node.y + self.ft_offset_y
-            x2 = cx + end_node.x + self.ft_offset_x
-            y2 = cy + end_node.y + self.ft_offset_y
-            
-            color = constants.COLOR_TEXT_DIM
-            width = 2
-            
-            if link_type == "SpouseLink":
-                # Parent to Hub: Draw from bottom of Parent to Center of Hub
-                # But Hub is on same Y level usually? No, Hub is virtual.
-                # In our layout, Hub is on same Y as parents.
-                # Draw line from Parent Side to Hub Center?
-                # Actually, let's draw: Parent Bottom -> Hub Center
-                
-                # Adjust start to bottom of parent
-                start_y_edge = y1 + (start_node.height // 2)
-                
-                # Draw L-shape or straight?
-                # If Hub is strictly between parents, straight line works if Y is same.
-                # If Y is same, draw horizontal line.
-                pygame.draw.line(self.screen, (100, 100, 100), (x1, y1), (x2, y2), 1)
-                
-            elif link_type == "ChildLink":
-                # Hub to Child: Draw "Bus" style
-                # Start at Hub Center
-                # Go Down half way
-                # Go Horizontal to Child X
-                # Go Down to Child Top
-                
-                mid_y = y1 + (self.ft_layout.LAYER_HEIGHT // 2)
-                target_y = y2 - (end_node.height // 2)
-                
-                # 1. Vertical Down from Hub
-                pygame.draw.line(self.screen, color, (x1, y1), (x1, mid_y), width)
-                # 2. Horizontal to Child Column
-                pygame.draw.line(self.screen, color, (x1, mid_y), (x2, mid_y), width)
-                # 3. Vertical Down to Child
-                pygame.draw.line(self.screen, color, (x2, mid_y), (x2, target_y), width)
-
-        # 5. Draw Nodes
-        for node in self.ft_layout.nodes.values():
-            if node.is_hub:
-                # Optional: Draw a small dot for the marriage hub for debug/clarity
-                # nx = cx + node.x + self.ft_offset_x
-                # ny = cy + node.y + self.ft_offset_y
-                # pygame.draw.circle(self.screen, (50, 50, 50), (nx, ny), 4)
-                continue
+        # Paths are routed once per build; edges outside the view are culled
+        # with one mask per batch, the rest offset in one step and drawn with
+        # one call per edge. Hubs follow all agents in the node order, so
+        # child links have always been drawn before spouse links.
+        layout = self.ft_layout
+        view = self.rect_center
+        screen = self.screen
+        draw_lines = pygame.draw.lines
+        offset = (ox, oy)
+        child_links = layout.child_link_points[self._in_view(layout.child_link_bounds, ox, oy, view)] + offset
+        spouse_links = layout.spouse_link_points[self._in_view(layout.spouse_link_bounds, ox, oy, view)] + offset
+        # No blits inside this block while the surface is locked
+        screen.lock()
+        try:
+            # Hub to Child: "Bus" style (down, across, down to the child's top)
+            for points in child_links.tolist():
+                draw_lines(screen, color_text_dim, False, points, 2)
+            # Parent to Hub: Hub sits on the parents' layer, so a thin straight line
+            for points in spouse_links.tolist():
+                draw_lines(screen, (100, 100, 100), False, points, 1)
+        finally:
+            screen.unlock()
+
+        # 5. Draw Nodes (agents only; marriage hubs are not drawn)
+        agent_nodes = layout.agent_nodes
+        visible = self._in_view(layout.agent_node_bounds, ox, oy, view)
+        for i in np.flatnonzero(visible).tolist():
+            node = agent_nodes[i]
                 
             # Screen Coords
-            nx = cx + node.x + self.ft_offset_x
-            ny = cy + node.y + self.ft_offset_y
+            nx = ox + node.x
+            ny = oy + node.y
             
             # Rect Geometry
             w, h = node.width, node.height
             rect = pygame.Rect(nx - w//2, ny - h//2, w, h)
             
-            # Skip if off-screen
-            if not rect.colliderect(self.rect_center):
+            # Skip if off-screen (the mask above is conservative by a pixel or two)
+            if not rect.colliderect(view):
                 continue
             
             # Colors
-            bg_col = constants.COLOR_PANEL_BG
-            border_col = constants.COLOR_BORDER
-            text_col = constants.COLOR_TEXT
+            bg_col = color_panel_bg
+            border_col = color_border
+            text_col = color_text
             
             node_agent = node.agent
             
@@ -1130,7 +1292,7 @@ class Renderer:
             # Dead State
             if not node_agent.is_alive:
                 bg_col = (30, 30, 30)
-                text_col = constants.COLOR_TEXT_DIM
+                text_col = color_text_dim
                 border_col = (80, 80, 80)
 
             # Draw Background
@@ -1142,8 +1304,9 @@ class Renderer:
             else:
                 self._draw_dashed_rect(self.screen, border_col, rect, width=2, dash_len=6)
             
-            # Text: Name
-            name_surf = self.font_main.render(node_agent.first_name, True, text_col)
+            # Text: Name (render_text keys on the string, so an age-up or
+            # death simply produces a new cache entry)
+            name_surf = render_text(self.font_main, node_agent.first_name, text_col)
             name_rect = name_surf.get_rect(center=(nx, ny - 10))
             self.screen.blit(name_surf, name_rect)
             
@@ -1152,7 +1315,7 @@ class Renderer:
             if not node_agent.is_alive:
                 age_txt = "Deceased"
             
-            sub_surf = self.font_log.render(age_txt, True, constants.COLOR_TEXT_DIM)
+            sub_surf = render_text(self.font_log, age_txt, color_text_dim)
             sub_rect = sub_surf.get_rect(center=(nx, ny + 10))
             self.screen.blit(sub_surf, sub_rect)
 
@@ -1167,36 +1330,62 @@ class Renderer:
         pygame.draw.line(self.screen, constants.COLOR_BORDER, header_bg.bottomleft, header_bg.bottomright)
         
         header_text = f"{agent.first_name}'s Family Tree"
-        header_surf = self.font_header.render(header_text, True, constants.COLOR_ACCENT)
+        header_surf = render_text(self.font_header, header_text, constants.COLOR_ACCENT)
         self.screen.blit(header_surf, (self.rect_center.x + 20, self.rect_center.y + 15))
         
         instr = "Left-Drag to Pan | Click to Focus | Right-Click for Stats"
-        instr_surf = self.font_log.render(instr, True, constants.COLOR_TEXT_DIM)
+        instr_surf = render_text(self.font_log, instr, constants.COLOR_TEXT_DIM)
         self.screen.blit(instr_surf, (self.rect_center.x + 20, self.rect_center.y + 55))
 
-        close_rect = pygame.Rect(self.rect_center.right - 30, self.rect_center.y + 10, 20, 20)
+        close_rect = self.rect_modal_close
         pygame.draw.rect(self.screen, constants.COLOR_DEATH, close_rect, border_radius=3)
         pygame.draw.line(self.screen, constants.COLOR_TEXT, close_rect.topleft, close_rect.bottomright, 2)
         pygame.draw.line(self.screen, constants.COLOR_TEXT, close_rect.bottomleft, close_rect.topright, 2)
 
     def _draw_ft_button(self, rect, agent):
         """Helper to draw the Family Tree button (Icon or Text)."""
+        # The button looks the same wherever it is drawn, so it is composed
+        # once per size and blitted. It is opaque (the icon blends exactly as
+        # it would on screen) with colorkeyed corners to keep the rounding.
+        # None marks sizes whose content overhangs the button (the left panel
+        # sizes it to the name text); those are drawn directly.
+        if rect.size not in self._ft_button_cache:
+            button = pygame.Surface(rect.size).convert()
+            button.fill(_COLORKEY)
+            button.set_colorkey(_COLORKEY)
+            if not self._draw_ft_button_face(button, button.get_rect()):
+                button = None
+            self._ft_button_cache[rect.size] = button
+        
+        button = self._ft_button_cache[rect.size]
+        if button is not None:
+            self.screen.blit(button, rect)
+        else:
+            self._draw_ft_button_face(self.screen, rect)
+            
+        # Register Interaction
+        self.ft_buttons.append((rect, agent))
+
+    def _draw_ft_button_face(self, surface, rect):
+        """
+        Draw the Family Tree button's background, border and icon (or text).
+        
+        Returns:
+            True if the icon or text fits inside rect.
+        """
         # Draw Button Background
-        pygame.draw.rect(self.screen, constants.COLOR_BTN_IDLE, rect, border_radius=4)
-        pygame.draw.rect(self.screen, constants.COLOR_BORDER, rect, 1, border_radius=4)
+        pygame.draw.rect(surface, constants.COLOR_BTN_IDLE, rect, border_radius=4)
+        pygame.draw.rect(surface, constants.COLOR_BORDER, rect, 1, border_radius=4)
         
         if self.icon_ft:
             # Center Icon
-            icon_rect = self.icon_ft.get_rect(center=rect.center)
-            self.screen.blit(self.icon_ft, icon_rect)
+            content = self.icon_ft
         else:
             # Fallback Text
-            ft_txt = self.font_log.render("FT", True, constants.COLOR_TEXT)
-            ft_txt_rect = ft_txt.get_rect(center=rect.center)
-            self.screen.blit(ft_txt, ft_txt_rect)
-            
-        # Register Interaction
-        self.ft_buttons.append((rect, agent))
+            content = render_text(self.font_log, "FT", constants.COLOR_TEXT)
+        content_rect = content.get_rect(center=rect.center)
+        surface.blit(content, content_rect)
+        return rect.contains(content_rect)
 
     def _draw_vertical_ap_bar(self, sim_state):
         """Draw vertical AP bar within the expanded left panel area."""
@@ -1212,7 +1401,6 @@ class Renderer:
         ap_bar.draw(self.screen, sim_state.player)
 
     def _draw_left_panel(self, sim_state):
-        self._draw_panel_background(self.rect_left, constants.UI_OPACITY_PANEL)
         pygame.draw.rect(self.screen, constants.COLOR_BORDER, self.rect_left, 1)
         
         player = sim_state.player
@@ -1222,13 +1410,13 @@ class Renderer:
         y = 30
         
         def draw_text(text, font=self.font_main, color=constants.COLOR_TEXT):
-            surf = font.render(text, True, color)
+            surf = render_text(font, text, color)
             self.screen.blit(surf, (x, y))
             return surf.get_height() + 5
 
         # Name & FT Button
         name_text = f"{player.first_name} {player.last_name}"
-        name_surf = self.font_header.render(name_text, True, constants.COLOR_ACCENT)
+        name_surf = render_text(self.font_header, name_text, constants.COLOR_ACCENT)
         self.screen.blit(name_surf, (x, y))
         
         # FT Button
@@ -1295,13 +1483,6 @@ class Renderer:
         if player.school:
             y += draw_text("--- Academics ---", color=constants.COLOR_TEXT_DIM)
             
-            # Helper function to get grade color
-            def get_grade_color(grade):
-                if grade >= 90: return constants.COLOR_LOG_POSITIVE  # Green
-                elif grade >= 70: return constants.COLOR_LOG_HEADER  # Blue  
-                elif grade >= 50: return (255, 255, 100)  # Yellow
-                else: return constants.COLOR_LOG_NEGATIVE  # Red
-            
             subjects = player.subjects
             subject_names = list(subjects.keys())
             row_height = self.font_main.get_height() + 5
@@ -1320,33 +1501,48 @@ class Renderer:
                 self.academics_scroll_offset:self.academics_scroll_offset + max_visible_rows
             ]
 
-            draw_y = viewport_y
-            for subject in visible_subjects:
-                grade = int(subjects[subject]["current_grade"])
-                color = get_grade_color(grade)
-
-                # Draw subject name and grade on same line with color
-                subject_text = f"{subject}: "
-                grade_text = str(grade)
-
-                subject_surf = self.font_main.render(subject_text, True, constants.COLOR_TEXT)
-                self.screen.blit(subject_surf, (x, draw_y))
-
-                grade_x = x + subject_surf.get_width()
-                grade_surf = self.font_main.render(grade_text, True, color)
-                grade_rect = pygame.Rect(grade_x, draw_y, grade_surf.get_width(), grade_surf.get_height())
-                self.screen.blit(grade_surf, (grade_x, draw_y))
-
-                self.tooltip_zones.append((grade_rect, subject))
-                draw_y += row_height
-
-            # Scroll hint for long lists.
-            if self.academics_scroll_max > 0:
-                first_visible = self.academics_scroll_offset + 1
-                last_visible = self.academics_scroll_offset + len(visible_subjects)
-                hint = f"{first_visible}-{last_visible}/{len(subject_names)} (Mouse Wheel)"
-                hint_surf = self.font_log.render(hint, True, constants.COLOR_TEXT_DIM)
-                self.screen.blit(hint_surf, (x, viewport_y + viewport_height - hint_surf.get_height() - 2))
+            # Grades change at most once per turn, so the rows (blits and
+            # grade tooltip zones) are laid out again only when a visible
+            # grade, the scroll position or the panel position changes
+            academics_key = (
+                x, viewport_y, self.academics_scroll_offset, len(subject_names),
+                tuple([(subject, int(subjects[subject]["current_grade"])) for subject in visible_subjects]),
+            )
+            if self._academics_rows is None or self._academics_rows[0] != academics_key:
+                row_blits = []
+                row_zones = []
+                draw_y = viewport_y
+                for subject, grade in academics_key[-1]:
+                    color = _GRADE_COLORS[max(0, min(100, grade))]
+
+                    # Draw subject name and grade on same line with color
+                    subject_text = f"{subject}: "
+                    grade_text = str(grade)
+
+                    subject_surf = render_text(self.font_main, subject_text, constants.COLOR_TEXT)
+                    row_blits.append((subject_surf, (x, draw_y)))
+
+                    grade_x = x + subject_surf.get_width()
+                    grade_surf = render_text(self.font_main, grade_text, color)
+                    grade_rect = pygame.Rect(grade_x, draw_y, grade_surf.get_width(), grade_surf.get_height())
+                    row_blits.append((grade_surf, (grade_x, draw_y)))
+
+                    row_zones.append((grade_rect, subject))
+                    draw_y += row_height
+
+                # Scroll hint for long lists.
+                if self.academics_scroll_max > 0:
+                    first_visible = self.academics_scroll_offset + 1
+                    last_visible = self.academics_scroll_offset + len(visible_subjects)
+                    hint = f"{first_visible}-{last_visible}/{len(subject_names)} (Mouse Wheel)"
+                    hint_surf = render_text(self.font_log, hint, constants.COLOR_TEXT_DIM)
+                    row_blits.append((hint_surf, (x, viewport_y + viewport_height - hint_surf.get_height() - 2)))
+
+                self._academics_rows = (academics_key, row_blits, row_zones)
+
+            _key, row_blits, row_zones = self._academics_rows
+            self.screen.blits(row_blits, doreturn=False)
+            self.tooltip_zones.extend(row_zones)
 
             y = viewport_y + viewport_height + 10
         else:
@@ -1367,8 +1563,54 @@ class Renderer:
                 
             y += draw_text(txt)
 
+    def _compose_tooltip_box(self, lines, line_height):
+        """
+        Compose a tooltip box (background, border, text) onto one surface.
+        
+        The box is opaque, so blitting it matches drawing its parts on the
+        screen. The last box is kept, so a tooltip held over one zone is a
+        single blit per frame.
+        
+        Args:
+            lines: List of (text, color) tuples, top to bottom.
+            line_height: Vertical distance between lines in pixels.
+            
+        Returns:
+            The composed box surface.
+        """
+        key = (tuple(lines), line_height)
+        if self._tooltip_box is not None and self._tooltip_box[0] == key:
+            return self._tooltip_box[1]
+        
+        surfaces = [render_text(self.font_log, text, color) for text, color in lines]
+        box_w = max((s.get_width() for s in surfaces), default=0) + 20  # Padding
+        box_h = len(surfaces) * line_height + 10
+        
+        box = pygame.Surface((box_w, box_h)).convert()
+        box.fill((20, 20, 20))
+        pygame.draw.rect(box, constants.COLOR_BORDER, box.get_rect(), 1)
+        box.blits([(s, (10, 5 + i * line_height)) for i, s in enumerate(surfaces)], doreturn=False)
+        
+        self._tooltip_box = (key, box)
+        return box
+
     def _wrap_tooltip_text(self, text, max_width):
         """Wraps tooltip text to fit in a bounded width."""
+        # A hovered tooltip re-wraps the same texts every frame, and each
+        # word costs a font.size() call, so results are kept in a small LRU.
+        # Callers only iterate the returned list.
+        key = (text, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            lines = self._wrap_cache[key] = self._wrap_words(text, max_width)
+            if len(self._wrap_cache) > _WRAP_CACHE_MAX:
+                self._wrap_cache.popitem(last=False)
+        else:
+            self._wrap_cache.move_to_end(key)
+        return lines
+
+    def _wrap_words(self, text, max_width):
+        """Greedy word wrap measured with the log font."""
         if not text:
             return []
         words = text.split()
@@ -1720,164 +1962,175 @@ class Renderer:
             return
 
         mx, my = pygame.mouse.get_pos()
-        for rect, attr_name, value, max_value in self.attribute_tooltip_zones:
-            if not rect.collidepoint((mx, my)):
-                continue
-
-            agent = self.viewing_agent
-            title, desc, factors, now = self._get_attribute_tooltip_data(agent, attr_name, value, max_value)
-
-            raw_lines = [
-                (f"{title}: {int(value) if isinstance(value, (int, float)) else value}", constants.COLOR_ACCENT),
-                (desc, constants.COLOR_TEXT),
-                ("Affects: " + ", ".join(factors[:5]), constants.COLOR_TEXT_DIM),
-                (now, constants.COLOR_TEXT),
-            ]
-
-            wrapped = []
-            max_line_width = 360
-            for i, (text, color) in enumerate(raw_lines):
-                if i == 0:
-                    wrapped.append((text, color))
-                    continue
-                for chunk in self._wrap_tooltip_text(text, max_line_width):
-                    wrapped.append((chunk, color))
-
-            line_height = 18
-            box_w = 0
-            surfaces = []
-            for text, color in wrapped:
-                s = self.font_log.render(text, True, color)
-                box_w = max(box_w, s.get_width())
-                surfaces.append(s)
-
-            box_w += 20
-            box_h = (len(surfaces) * line_height) + 10
-            bg_rect = pygame.Rect(mx + 15, my + 15, box_w, box_h)
+        zone = self._zone_at(self.attribute_tooltip_zones, (mx, my))
+        if zone is None:
+            return
+        _rect, attr_name, value, max_value = zone
 
-            if bg_rect.right > self.screen_width:
-                bg_rect.x -= box_w + 30
-            if bg_rect.bottom > self.screen_height:
-                bg_rect.y -= box_h + 30
-            if bg_rect.x < 0:
-                bg_rect.x = 0
-            if bg_rect.y < 0:
-                bg_rect.y = 0
+        agent = self.viewing_agent
+        title, desc, factors, now = self._get_attribute_tooltip_data(agent, attr_name, value, max_value)
 
-            pygame.draw.rect(self.screen, (20, 20, 20), bg_rect)
-            pygame.draw.rect(self.screen, constants.COLOR_BORDER, bg_rect, 1)
+        raw_lines = [
+            (f"{title}: {int(value) if isinstance(value, (int, float)) else value}", constants.COLOR_ACCENT),
+            (desc, constants.COLOR_TEXT),
+            ("Affects: " + ", ".join(factors[:5]), constants.COLOR_TEXT_DIM),
+            (now, constants.COLOR_TEXT),
+        ]
 
-            curr_y = bg_rect.y + 5
-            for s in surfaces:
-                self.screen.blit(s, (bg_rect.x + 10, curr_y))
-                curr_y += line_height
-            break
+        wrapped = []
+        max_line_width = 360
+        for i, (text, color) in enumerate(raw_lines):
+            if i == 0:
+                wrapped.append((text, color))
+                continue
+            for chunk in self._wrap_tooltip_text(text, max_line_width):
+                wrapped.append((chunk, color))
+
+        box = self._compose_tooltip_box(wrapped, 18)
+        box_w, box_h = box.get_size()
+        bg_rect = pygame.Rect(mx + 15, my + 15, box_w, box_h)
+
+        if bg_rect.right > self.screen_width:
+            bg_rect.x -= box_w + 30
+        if bg_rect.bottom > self.screen_height:
+            bg_rect.y -= box_h + 30
+        if bg_rect.x < 0:
+            bg_rect.x = 0
+        if bg_rect.y < 0:
+            bg_rect.y = 0
+
+        self.screen.blit(box, bg_rect)
+
+    @staticmethod
+    def _in_view(bounds, ox, oy, view, margin=2):
+        """
+        Mask the boxes that may overlap a view rect once offset on screen.
+        
+        Args:
+            bounds: (N, 4) array of left, top, right, bottom in layout coordinates.
+            ox, oy: Screen position of the layout origin.
+            view: pygame.Rect to test against.
+            margin: Slack in pixels for line width and integer rounding, so
+                nothing visible is ever culled.
+            
+        Returns:
+            (N,) boolean array.
+        """
+        # The view is moved into layout space instead of offsetting every box
+        return ((bounds[:, 0] <= view.right - ox + margin)
+                & (bounds[:, 2] >= view.left - ox - margin)
+                & (bounds[:, 1] <= view.bottom - oy + margin)
+                & (bounds[:, 3] >= view.top - oy - margin))
+
+    @staticmethod
+    def _zone_at(zones, pos):
+        """
+        Find the first hit zone containing a screen position.
+        
+        The scan runs in C via Rect.collideobjects. A 1x1 rect overlaps a
+        zone exactly when collidepoint() would report the point inside it.
+        
+        Args:
+            zones: List of tuples whose first item is a pygame.Rect.
+            pos: (x, y) screen position.
+            
+        Returns:
+            The first matching zone tuple in list order, or None.
+        """
+        return pygame.Rect(pos, (1, 1)).collideobjects(zones, key=_zone_rect)
 
     def _draw_grade_tooltips(self, sim_state):
         """Draw tooltips for grade hover/click zones."""
+        if not self.tooltip_zones:
+            return
+        
         mx, my = pygame.mouse.get_pos()
         
-        for rect, subject_name in self.tooltip_zones:
-            if rect.collidepoint((mx, my)):
-                player = sim_state.player
-                if subject_name in player.subjects:
-                    subject_data = player.subjects[subject_name]
-
-                    # Build tooltip lines
-                    lines = []
-                    lines.append((f"{subject_name} Details", constants.COLOR_ACCENT))
-                    lines.append((f"Current Grade: {int(subject_data['current_grade'])}", constants.COLOR_TEXT))
-
-                    # Rebuild natural-aptitude formula inputs for full transparency.
-                    category = player._classify_subject_category(subject_name)
-                    profile = player._get_subject_profile(category)
-                    trait_inputs = player._subject_trait_inputs()
-                    weights = profile.get("weights", {})
-
-                    raw_sum = 0.0
-                    lines.append((f"Natural Aptitude: {int(subject_data['natural_aptitude'])}", constants.COLOR_TEXT))
-                    lines.append((f"Category: {category}", constants.COLOR_TEXT_DIM))
-                    lines.append(("Aptitude Inputs:", constants.COLOR_TEXT_DIM))
-
-                    label_map = {
-                        "analytical": "Analytical",
-                        "verbal": "Verbal",
-                        "spatial": "Spatial",
-                        "working_memory": "Working Memory",
-                        "long_term_memory": "Long-term Memory",
-                        "secondary_cognitive": "Secondary Cognitive",
-                        "competence": "Conscientiousness-Competence",
-                        "ideas": "Openness-Ideas",
-                        "aesthetics": "Openness-Aesthetics",
-                        "values": "Openness-Values",
-                        "athleticism": "Athleticism"
-                    }
-
-                    for key, weight in weights.items():
-                        value = float(trait_inputs.get(key, 50.0))
-                        contribution = value * float(weight)
-                        raw_sum += contribution
-                        label = label_map.get(key, key.replace("_", " ").title())
-                        lines.append((
-                            f"{label}: {value:.1f} x {float(weight):.2f} = {contribution:.1f}",
-                            constants.COLOR_TEXT
-                        ))
-
-                    computed_natural = max(0.0, min(100.0, raw_sum))
-                    lines.append((f"Raw Sum: {raw_sum:.1f}", constants.COLOR_TEXT_DIM))
-                    lines.append((f"Clamped (0-100): {computed_natural:.1f}", constants.COLOR_TEXT_DIM))
-                    
-                    # Monthly change with color
-                    change = subject_data['monthly_change']
-                    if change > 0:
-                        change_text = f"This Month: +{change}"
-                        change_color = constants.COLOR_LOG_POSITIVE
-                    elif change < 0:
-                        change_text = f"This Month: {change}"
-                        change_color = constants.COLOR_LOG_NEGATIVE
-                    else:
-                        change_text = "This Month: 0"
-                        change_color = constants.COLOR_TEXT_DIM
-                    
-                    lines.append((change_text, change_color))
-                    
-                    # Calculate box size
-                    line_height = 20
-                    box_w = 0
-                    box_h = len(lines) * line_height + 10
-                    
-                    surfaces = []
-                    for text, color in lines:
-                        s = self.font_log.render(text, True, color)
-                        box_w = max(box_w, s.get_width())
-                        surfaces.append(s)
+        zone = self._zone_at(self.tooltip_zones, (mx, my))
+        if zone is None:
+            return
+        subject_name = zone[1]
+        player = sim_state.player
+        if subject_name in player.subjects:
+            subject_data = player.subjects[subject_name]
+
+            # Build tooltip lines
+            lines = []
+            lines.append((f"{subject_name} Details", constants.COLOR_ACCENT))
+            lines.append((f"Current Grade: {int(subject_data['current_grade'])}", constants.COLOR_TEXT))
+
+            # Rebuild natural-aptitude formula inputs for full transparency.
+            category = player._classify_subject_category(subject_name)
+            profile = player._get_subject_profile(category)
+            trait_inputs = player._subject_trait_inputs()
+            weights = profile.get("weights", {})
+
+            raw_sum = 0.0
+            lines.append((f"Natural Aptitude: {int(subject_data['natural_aptitude'])}", constants.COLOR_TEXT))
+            lines.append((f"Category: {category}", constants.COLOR_TEXT_DIM))
+            lines.append(("Aptitude Inputs:", constants.COLOR_TEXT_DIM))
+
+            label_map = {
+                "analytical": "Analytical",
+                "verbal": "Verbal",
+                "spatial": "Spatial",
+                "working_memory": "Working Memory",
+                "long_term_memory": "Long-term Memory",
+                "secondary_cognitive": "Secondary Cognitive",
+                "competence": "Conscientiousness-Competence",
+                "ideas": "Openness-Ideas",
+                "aesthetics": "Openness-Aesthetics",
+                "values": "Openness-Values",
+                "athleticism": "Athleticism"
+            }
+
+            for key, weight in weights.items():
+                value = float(trait_inputs.get(key, 50.0))
+                contribution = value * float(weight)
+                raw_sum += contribution
+                label = label_map.get(key, key.replace("_", " ").title())
+                lines.append((
+                    f"{label}: {value:.1f} x {float(weight):.2f} = {contribution:.1f}",
+                    constants.COLOR_TEXT
+                ))
+
+            computed_natural = max(0.0, min(100.0, raw_sum))
+            lines.append((f"Raw Sum: {raw_sum:.1f}", constants.COLOR_TEXT_DIM))
+            lines.append((f"Clamped (0-100): {computed_natural:.1f}", constants.COLOR_TEXT_DIM))
                     
-                    box_w += 20  # Padding
+            # Monthly change with color
+            change = subject_data['monthly_change']
+            if change > 0:
+                change_text = f"This Month: +{change}"
+                change_color = constants.COLOR_LOG_POSITIVE
+            elif change < 0:
+                change_text = f"This Month: {change}"
+                change_color = constants.COLOR_LOG_NEGATIVE
+            else:
+                change_text = "This Month: 0"
+                change_color = constants.COLOR_TEXT_DIM
                     
-                    # Position tooltip
-                    bg_rect = pygame.Rect(mx + 15, my + 15, box_w, box_h)
+            lines.append((change_text, change_color))
                     
-                    # Keep tooltip on screen
-                    if bg_rect.right > self.screen_width:
-                        bg_rect.x -= box_w + 30
-                    if bg_rect.bottom > self.screen_height:
-                        bg_rect.y -= box_h + 30
-                    if bg_rect.x < 0:
-                        bg_rect.x = 0
-                    if bg_rect.y < 0:
-                        bg_rect.y = 0
+            # Compose box
+            box = self._compose_tooltip_box(lines, 20)
+            box_w, box_h = box.get_size()
                     
-                    # Draw tooltip background and border
-                    pygame.draw.rect(self.screen, (20, 20, 20), bg_rect)
-                    pygame.draw.rect(self.screen, constants.COLOR_BORDER, bg_rect, 1)
+            # Position tooltip
+            bg_rect = pygame.Rect(mx + 15, my + 15, box_w, box_h)
                     
-                    # Draw text
-                    curr_y = bg_rect.y + 5
-                    for s in surfaces:
-                        self.screen.blit(s, (bg_rect.x + 10, curr_y))
-                        curr_y += line_height
+            # Keep tooltip on screen
+            if bg_rect.right > self.screen_width:
+                bg_rect.x -= box_w + 30
+            if bg_rect.bottom > self.screen_height:
+                bg_rect.y -= box_h + 30
+            if bg_rect.x < 0:
+                bg_rect.x = 0
+            if bg_rect.y < 0:
+                bg_rect.y = 0
                     
-                    break  # Only show one tooltip at a time
+            # Draw tooltip (background, border and text in one blit)
+            self.screen.blit(box, bg_rect)
 
     def _adjust_academics_scroll(self, delta):
         """Adjusts academics viewport scroll offset safely."""
@@ -1900,7 +2153,6 @@ class Renderer:
         )
 
     def _draw_right_panel(self, sim_state):
-        self._draw_panel_background(self.rect_right, constants.UI_OPACITY_PANEL)
         pygame.draw.rect(self.screen, constants.COLOR_BORDER, self.rect_right, 1)
 
         # Keep active tab valid when school enrollment changes.
@@ -1919,15 +2171,18 @@ class Renderer:
         
         # Draw Buttons for Active Tab with Dynamic Layout
         current_y = self.rect_right.y + 60
+        self.visible_buttons = []
         
         if self.active_tab in self.buttons:
             gap = 12
+            player_flags = _player_ui_flags(sim_state.player)
             
             for btn in self.buttons[self.active_tab]:
                 # Check Visibility
-                rule = self.visibility_rules.get(btn.action_id)
-                if rule and not rule(sim_state.player):
+                required = self.visibility_rules.get(btn.action_id, 0)
+                if (player_flags & required) != required:
                     continue
+                self.visible_buttons.append(btn)
                 
                 # Update Position (Dynamic Layout)
                 btn.rect.y = current_y
@@ -1940,7 +2195,7 @@ class Renderer:
         if self.active_tab == "Social":
             # Draw header outside the scrollable panel
             header_y = current_y + 10
-            header_surf = self.font_header.render("Relationships", True, constants.COLOR_ACCENT)
+            header_surf = render_text(self.font_header, "Relationships", constants.COLOR_ACCENT)
             self.screen.blit(header_surf, (self.rect_right.x + 20, header_y))
             
             # Update relationship panel position and data (below header)
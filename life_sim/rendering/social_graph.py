@@ -7,6 +7,71 @@ import pygame
 import numpy as np
 import random
 from .. import constants
+from . import quadtree
+
+
+def _bond_factors(rel_vals):
+    """
+    Returns the spring multiplier for each relationship value.
+    Piecewise-linear over negative / weak / moderate / strong bond tiers.
+    """
+    rel_vals = np.asarray(rel_vals, dtype=np.float64)
+    factor = np.zeros_like(rel_vals)
+
+    # Negative relationships: linear repulsion
+    neg = rel_vals < 0
+    factor[neg] = -constants.GRAPH_NEGATIVE_REPULSION_MAX * (np.abs(rel_vals[neg]) / 100.0)
+
+    # Weak bonds: 0 to WEAK_THRESHOLD
+    w = constants.GRAPH_WEAK_BOND_THRESHOLD
+    m = constants.GRAPH_MODERATE_BOND_THRESHOLD
+    weak  = (~neg) & (rel_vals <= w)
+    factor[weak] = (constants.GRAPH_WEAK_ATTRACTION_MIN +
+                    (rel_vals[weak] / w) *
+                    (constants.GRAPH_WEAK_ATTRACTION_MAX - constants.GRAPH_WEAK_ATTRACTION_MIN))
+
+    # Moderate bonds: WEAK_THRESHOLD to MODERATE_THRESHOLD
+    mod = (~neg) & (rel_vals > w) & (rel_vals <= m)
+    factor[mod] = (constants.GRAPH_MODERATE_ATTRACTION_MIN +
+                ((rel_vals[mod] - w) / (m - w)) *
+                (constants.GRAPH_MODERATE_ATTRACTION_MAX - constants.GRAPH_MODERATE_ATTRACTION_MIN))
+
+    # Strong bonds: MODERATE_THRESHOLD to 100
+    strong = (~neg) & (rel_vals > m)
+    factor[strong] = (constants.GRAPH_STRONG_ATTRACTION_MIN +
+                    ((rel_vals[strong] - m) / (100.0 - m)) *
+                    (constants.GRAPH_STRONG_ATTRACTION_MAX - constants.GRAPH_STRONG_ATTRACTION_MIN))
+
+    return factor
+
+
+# Relationship scores are ints in [-100, 100]; index with score + 100.
+# Covers the negative (repulsive) range too, so lookups need no branching.
+_BOND_FACTOR_LUT = _bond_factors(np.arange(-100, 101))
+
+
+def _relationship_color(score):
+    """Gradient color for a relationship score (see SocialGraphLayout._get_relationship_color)."""
+    if score >= 0:
+        # Green Interpolation (0 -> Light Gray, 100 -> Bright Green)
+        t = score / 100.0
+        # Light Gray (200,200,200) to Green (50, 255, 50)
+        r = int(200 * (1-t) + 50 * t)
+        g = int(200 * (1-t) + 255 * t)
+        b = int(200 * (1-t) + 50 * t)
+    else:
+        # Red Interpolation (0 -> Light Gray, -100 -> Deep Red)
+        t = abs(score) / 100.0
+        # Light Gray (200,200,200) to Red (220, 20, 20)
+        r = int(200 * (1-t) + 220 * t)
+        g = int(200 * (1-t) + 20 * t)
+        b = int(200 * (1-t) + 20 * t)
+    return (r, g, b)
+
+
+# Colors of the integer scores, indexed like _BOND_FACTOR_LUT
+_REL_COLOR_LUT = tuple(_relationship_color(v) for v in range(-100, 101))
+
 
 class SocialGraphLayout:
     """
@@ -65,21 +130,11 @@ class SocialGraphLayout:
         +100 -> Bright Green (50, 255, 50)
         -100 -> Deep Red (220, 20, 20)
         """
-        if score >= 0:
-            # Green Interpolation (0 -> Light Gray, 100 -> Bright Green)
-            t = score / 100.0
-            # Light Gray (200,200,200) to Green (50, 255, 50)
-            r = int(200 * (1-t) + 50 * t)
-            g = int(200 * (1-t) + 255 * t)
-            b = int(200 * (1-t) + 50 * t)
-        else:
-            # Red Interpolation (0 -> Light Gray, -100 -> Deep Red)
-            t = abs(score) / 100.0
-            # Light Gray (200,200,200) to Red (220, 20, 20)
-            r = int(200 * (1-t) + 220 * t)
-            g = int(200 * (1-t) + 20 * t)
-            b = int(200 * (1-t) + 20 * t)
-        return (r, g, b)
+        # Relationship totals are ints in [-100, 100] and come from the table;
+        # fractional values (affinity factors, modifiers) use the formula
+        if type(score) is int and -100 <= score <= 100:
+            return _REL_COLOR_LUT[score + 100]
+        return _relationship_color(score)
     
     def _get_edge_color_and_width(self, rel_val):
         """
@@ -438,21 +493,25 @@ class SocialGraphLayout:
         self._radii_arr = np.array(self.radii, dtype=np.float64)
 
         # Cache edge arrays as NumPy for vectorized physics
+        # Scores are ints clamped to [-100, 100], so int8 holds them exactly
         if self.edges:
-            edge_arr = np.array(self.edges, dtype=np.float64)
-            self._edge_u   = edge_arr[:, 0].astype(np.intp)
-            self._edge_v   = edge_arr[:, 1].astype(np.intp)
-            self._edge_vals = edge_arr[:, 2]
+            edge_u, edge_v, edge_vals = zip(*self.edges)
+            self._edge_u   = np.array(edge_u, dtype=np.intp)
+            self._edge_v   = np.array(edge_v, dtype=np.intp)
+            self._edge_vals = np.array(edge_vals, dtype=np.int8)
             # Plain Python lists for the draw loop — avoids tuple unpack per iteration
             self._edge_u_list = self._edge_u.tolist()
             self._edge_v_list = self._edge_v.tolist()
         else:
             self._edge_u   = np.array([], dtype=np.intp)
             self._edge_v   = np.array([], dtype=np.intp)
-            self._edge_vals = np.array([], dtype=np.float64)
+            self._edge_vals = np.array([], dtype=np.int8)
             self._edge_u_list = []
             self._edge_v_list = []
 
+        # Spring magnitude per edge; relationship values are frozen until the next build()
+        self._edge_spring = constants.GRAPH_ATTRACTION * _BOND_FACTOR_LUT[self._edge_vals.astype(np.intp) + 100]
+
         # Pre-allocate workspace arrays for edge visibility culling in draw()
         E = len(self.edges)
         self._edge_vis_u_pos  = np.empty((E, 2), dtype=np.float64)
@@ -460,6 +519,25 @@ class SocialGraphLayout:
         self._edge_vis_min    = np.empty((E, 2), dtype=np.float64)
         self._edge_vis_max    = np.empty((E, 2), dtype=np.float64)
         self._edge_vis_mask   = np.empty(E, dtype=np.bool_)
+
+        # Pre-allocate physics workspaces so update_physics() reuses them every tick
+        self._phys_node_buf   = np.empty((self.count, 2), dtype=np.float64)
+        self._phys_edge_delta = np.empty((E, 2), dtype=np.float64)
+        self._phys_edge_buf   = np.empty((E, 2), dtype=np.float64)
+        self._phys_edge_dist  = np.empty(E, dtype=np.float64)
+        self._phys_edge_scale = np.empty(E, dtype=np.float64)
+        # Spring forces scatter in one bincount over the flattened (N, 2) force
+        # array: slot 2*node + axis. The first 2E weights are the forces pulling
+        # each v toward its u, the last 2E their negation applied to u (Newton's 3rd).
+        xy = np.array([0, 1], dtype=np.intp)
+        self._phys_scatter_idx = np.concatenate((
+            (2 * self._edge_v[:, np.newaxis] + xy).ravel(),
+            (2 * self._edge_u[:, np.newaxis] + xy).ravel(),
+        ))
+        self._phys_scatter_w  = np.empty(4 * E, dtype=np.float64)
+        # (E, 2) views of the two halves, so forces are written straight into the weights
+        self._phys_edge_force     = self._phys_scatter_w[:2 * E].reshape(E, 2)
+        self._phys_edge_force_neg = self._phys_scatter_w[2 * E:].reshape(E, 2)
         
         # Build spatial grid for efficient viewport culling
         self._build_spatial_grid()
@@ -467,6 +545,36 @@ class SocialGraphLayout:
         # Pre-render node surfaces for the current node set and zoom level
         self._rebuild_node_surfaces()
 
+    def _exact_repulsion(self):
+        """
+        All-pairs O(N^2) repulsion (Vectorized, tiled).
+        Processes GRAPH_REPULSION_BLOCK target rows at a time so the pairwise
+        temporaries stay (BLOCK, N, 2) instead of (N, N, 2).
+        """
+        total_force = np.empty_like(self.pos)
+        block = constants.GRAPH_REPULSION_BLOCK
+
+        for start in range(0, self.count, block):
+            targets = self.pos[start:start + block]
+
+            # diff[i, j] = targets[i] - pos[j]: shape (B, N, 2)
+            diff = targets[:, np.newaxis, :] - self.pos[np.newaxis, :, :]
+
+            # Distance squared: shape (B, N)
+            # einsum reduces over the xy axis without materialising diff**2
+            dist_sq = np.einsum('ijk,ijk->ij', diff, diff)
+
+            # Force magnitude: F = k / d^2
+            # We clamp distance to avoid exploding forces for very close nodes.
+            # Self-pairs have zero diff, so they contribute nothing.
+            np.maximum(dist_sq, 1.0, out=dist_sq)
+            force_mag = np.divide(constants.GRAPH_REPULSION, dist_sq, out=dist_sq)
+
+            # Fused scale + reduce over sources: no (B, N, 2) forces temporary
+            total_force[start:start + block] = np.einsum('ijk,ij->ik', diff, force_mag)
+
+        return total_force
+
     def update_physics(self):
         """
         Applies force-directed graph logic:
@@ -476,85 +584,50 @@ class SocialGraphLayout:
         """
         if self.count == 0: return
 
-        # 1. Repulsion (Vectorized)
-        # Calculate delta vectors between all pairs: shape (N, N, 2)
-        # diff[i, j] = pos[i] - pos[j]
-        diff = self.pos[:, np.newaxis, :] - self.pos[np.newaxis, :, :]
-        
-        # Distance squared: shape (N, N)
-        dist_sq = np.sum(diff**2, axis=2)
-        
-        # Avoid division by zero (add epsilon to diagonal)
-        np.fill_diagonal(dist_sq, np.inf)
-        
-        # Force magnitude: F = k / d^2
-        # We clamp distance to avoid exploding forces for very close nodes
-        dist_sq = np.maximum(dist_sq, 1.0)
-        force_mag = constants.GRAPH_REPULSION / dist_sq
-        
-        forces = diff * force_mag[:, :, np.newaxis]
-        
-        # Sum forces acting on each node i (sum over j)
-        total_force = np.sum(forces, axis=1)
+        # 1. Repulsion
+        # Large graphs use the Barnes-Hut approximation; small ones stay exact.
+        if self.count >= constants.GRAPH_BARNES_HUT_MIN_NODES:
+            total_force = quadtree.repulsion_forces(
+                self.pos, constants.GRAPH_REPULSION, constants.GRAPH_BARNES_HUT_THETA
+            )
+        else:
+            total_force = self._exact_repulsion()
 
         # 2a. Center Gravity (Pull towards center of bounds)
-        center_vec = self.center - self.pos
-        total_force += center_vec * constants.GRAPH_CENTER_GRAVITY
+        center_vec = np.subtract(self.center, self.pos, out=self._phys_node_buf)
+        center_vec *= constants.GRAPH_CENTER_GRAVITY
+        total_force += center_vec
 
         # 2b. Spring Attraction (Vectorized)
         if len(self.edges) > 0:
-            # Pre-built edge arrays (cache these in build() as self._edge_u, etc.)
+            # Pre-built edge arrays; spring magnitudes are fixed until the next build()
             u_idx = self._edge_u          # shape (E,)
             v_idx = self._edge_v          # shape (E,)
-            rel_vals = self._edge_vals    # shape (E,) float64
 
             # --- Geometry (all vectorized) ---
-            delta = self.pos[u_idx] - self.pos[v_idx]          # (E, 2)
-            dist  = np.linalg.norm(delta, axis=1)              # (E,)
-
-            # Mask out edges shorter than min distance
-            valid = dist >= constants.GRAPH_MIN_DISTANCE       # (E,) bool
-            # Avoid division by zero on invalid entries
-            safe_dist = np.where(valid, dist, 1.0)
-            direction = delta / safe_dist[:, np.newaxis]       # (E, 2)
-
-            # --- Piecewise factor calculation (vectorized) ---
-            factor = np.zeros_like(rel_vals)
-
-            # Negative relationships: linear repulsion
-            neg = rel_vals < 0
-            factor[neg] = -constants.GRAPH_NEGATIVE_REPULSION_MAX * (np.abs(rel_vals[neg]) / 100.0)
-
-            # Weak bonds: 0 to WEAK_THRESHOLD
-            w = constants.GRAPH_WEAK_BOND_THRESHOLD
-            m = constants.GRAPH_MODERATE_BOND_THRESHOLD
-            weak  = (~neg) & (rel_vals <= w)
-            factor[weak] = (constants.GRAPH_WEAK_ATTRACTION_MIN +
-                            (rel_vals[weak] / w) *
-                            (constants.GRAPH_WEAK_ATTRACTION_MAX - constants.GRAPH_WEAK_ATTRACTION_MIN))
-
-            # Moderate bonds: WEAK_THRESHOLD to MODERATE_THRESHOLD
-            mod = (~neg) & (rel_vals > w) & (rel_vals <= m)
-            factor[mod] = (constants.GRAPH_MODERATE_ATTRACTION_MIN +
-                        ((rel_vals[mod] - w) / (m - w)) *
-                        (constants.GRAPH_MODERATE_ATTRACTION_MAX - constants.GRAPH_MODERATE_ATTRACTION_MIN))
-
-            # Strong bonds: MODERATE_THRESHOLD to 100
-            strong = (~neg) & (rel_vals > m)
-            factor[strong] = (constants.GRAPH_STRONG_ATTRACTION_MIN +
-                            ((rel_vals[strong] - m) / (100.0 - m)) *
-                            (constants.GRAPH_STRONG_ATTRACTION_MAX - constants.GRAPH_STRONG_ATTRACTION_MIN))
+            delta = np.take(self.pos, u_idx, axis=0, out=self._phys_edge_delta)   # (E, 2)
+            delta -= np.take(self.pos, v_idx, axis=0, out=self._phys_edge_buf)
+            dist  = np.einsum('ij,ij->i', delta, delta, out=self._phys_edge_dist)  # (E,)
+            np.sqrt(dist, out=dist)
+
+            # Edges shorter than min distance exert no pull (direction undefined)
+            valid = dist >= constants.GRAPH_MIN_DISTANCE
+            scale = self._phys_edge_scale
+            scale.fill(0.0)
+            np.divide(self._edge_spring, dist, out=scale, where=valid)
+            force = np.multiply(delta, scale[:, np.newaxis], out=self._phys_edge_force)  # (E, 2)
 
             # --- Force application (vectorized scatter) ---
-            force_mag = (constants.GRAPH_ATTRACTION * factor * valid)[:, np.newaxis]  # (E, 1)
-            force     = direction * force_mag                                          # (E, 2)
-
-            # np.add.at handles duplicate indices correctly (unlike +=)
-            np.add.at(total_force, v_idx,  force)   # Pull v toward u
-            np.add.at(total_force, u_idx, -force)   # Pull u toward v (Newton's 3rd)
+            # bincount sums duplicate indices correctly and is much cheaper than
+            # np.add.at; one call covers both endpoints and both axes
+            n = self.count
+            np.negative(force, out=self._phys_edge_force_neg)  # Pull u toward v
+            total_force += np.bincount(self._phys_scatter_idx, self._phys_scatter_w, 2 * n).reshape(n, 2)
 
         # 3. Integration (Euler)
-        self.vel += total_force * constants.GRAPH_SPEED * constants.GRAPH_TIME_STEP
+        # In-place so pos/vel/total_force never reallocate between ticks
+        total_force *= constants.GRAPH_SPEED * constants.GRAPH_TIME_STEP
+        self.vel += total_force
         self.vel *= constants.GRAPH_FRICTION # Damping
         self.pos += self.vel
 
@@ -665,15 +738,20 @@ class SocialGraphLayout:
         edge_u_list     = self._edge_u_list
         edge_v_list     = self._edge_v_list
 
-        for i in visible_edge_indices:
-            color = edge_colors[i]
-            width = scaled_edge_widths[i]   # pre-scaled, see change #4
+        # Lines only until unlock: blits fail on a locked surface
+        screen.lock()
+        try:
+            for i in visible_edge_indices:
+                color = edge_colors[i]
+                width = scaled_edge_widths[i]   # pre-scaled, see change #4
 
-            if i == hover_edge:
-                color = (255, 255, 200)
-                width += 2
+                if i == hover_edge:
+                    color = (255, 255, 200)
+                    width += 2
 
-            draw_line(screen, color, draw_pos_list[edge_u_list[i]], draw_pos_list[edge_v_list[i]], width)
+                draw_line(screen, color, draw_pos_list[edge_u_list[i]], draw_pos_list[edge_v_list[i]], width)
+        finally:
+            screen.unlock()
 
         # --- 2. Draw Nodes (blit pre-rendered surfaces — no draw.circle in loop) ---
         for i in visible_indices:
@@ -702,7 +780,7 @@ class SocialGraphLayout:
                 cache_key = (label, label_opacity)
                 surf = label_surfaces.get(cache_key)
                 if surf is None:
-                    base = font.render(label, True, constants.COLOR_TEXT)
+                    base = font.render(label, True, constants.COLOR_TEXT).convert_alpha()
                     if label_opacity < 255:
                         base.set_alpha(label_opacity)
                     label_surfaces[cache_key] = base
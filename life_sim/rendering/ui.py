@@ -3,9 +3,32 @@
 UI Widget Module.
 Contains classes for Buttons, Panels, and Scrollable elements.
 """
+from collections import OrderedDict
+
 import pygame
 from .. import constants
 
+# Rendered text keyed by (font, text, color); most labels repeat every frame
+_TEXT_CACHE = OrderedDict()
+_TEXT_CACHE_MAX = 1024
+
+def render_text(font, text, color):
+    """
+    Antialiased font.render() that reuses the surface of an identical earlier call.
+    Returned surfaces are shared: blit them, never draw onto them.
+    """
+    key = (font, text, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        # Converted once to the display format, so blits never convert per pixel
+        surface = font.render(text, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surface
+        if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surface
+
 class Button:
     """A clickable button with text."""
     def __init__(self, x, y, w, h, text, action_id, font):
@@ -39,7 +62,7 @@ class Button:
         pygame.draw.rect(screen, color, self.rect, border_radius=6)
         pygame.draw.rect(screen, constants.COLOR_BORDER, self.rect, 1, border_radius=6)
         
-        text_surf = self.font.render(self.text, True, text_color)
+        text_surf = render_text(self.font, self.text, text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -50,6 +73,8 @@ class LogPanel:
         self.font = font
         self.scroll_offset = 0 
         self.logs = [] # List of dicts from get_flat_log_for_rendering
+        self.draw_background = True # Off when the owner pre-composites the tint
+        self._background = None # Cached translucent backdrop (rebuilt on resize)
         self.total_content_height = 0
 
     def update_position(self, x, y, w, h):
@@ -141,10 +166,13 @@ class LogPanel:
 
     def draw(self, screen):
         # Draw transparent background
-        s = pygame.Surface((self.rect.width, self.rect.height))
-        s.set_alpha(constants.UI_OPACITY_CENTER)
-        s.fill((20, 20, 20))  # Dark grey background
-        screen.blit(s, (self.rect.x, self.rect.y))
+        if self.draw_background:
+            # Built once per panel size instead of every frame
+            if self._background is None or self._background.get_size() != self.rect.size:
+                self._background = pygame.Surface(self.rect.size)
+                self._background.set_alpha(constants.UI_OPACITY_CENTER)
+                self._background.fill(constants.COLOR_PANEL_TINT)  # Dark grey background
+            screen.blit(self._background, (self.rect.x, self.rect.y))
         
         old_clip = screen.get_clip()
         screen.set_clip(self.rect)
@@ -469,11 +497,8 @@ class NumberStepper:
         
     def handle_event(self, event):
         """Handle button clicks and return step changes."""
-        # Handle button hover states
-        self.minus_btn.handle_event(event)
-        self.plus_btn.handle_event(event)
-        
-        # Check for button clicks
+        # One pass per button both updates its hover state (motion) and
+        # reports a click; a click on [-] cannot also be on [+]
         result = self.minus_btn.handle_event(event)
         if result == "STEPPER_MINUS":
             self.value = max(self.min_val, self.value - self.step)
@@ -527,6 +552,7 @@ class RelationshipPanel:
         self.scroll_offset = 0 
         self.relationships = []  # List of relationship data
         self.total_content_height = 0
+        self._background = None  # Cached translucent backdrop (rebuilt on resize)
         self.card_height = 90
         self.card_gap = 10
         
@@ -623,11 +649,12 @@ class RelationshipPanel:
     
     def draw(self, screen, sim_state):
         """Draw the scrollable relationship panel."""
-        # Draw background
-        s = pygame.Surface((self.rect.width, self.rect.height))
-        s.set_alpha(200)  # Same as UI_OPACITY_CENTER
-        s.fill((20, 20, 20))
-        screen.blit(s, (self.rect.x, self.rect.y))
+        # Draw background (built once per panel size instead of every frame)
+        if self._background is None or self._background.get_size() != self.rect.size:
+            self._background = pygame.Surface(self.rect.size)
+            self._background.set_alpha(constants.UI_OPACITY_CENTER)
+            self._background.fill(constants.COLOR_PANEL_TINT)
+        screen.blit(self._background, (self.rect.x, self.rect.y))
         
         # Clip drawing to panel bounds
         old_clip = screen.get_clip()
@@ -665,8 +692,8 @@ class RelationshipPanel:
                 name_color = (120, 120, 120)  # COLOR_TEXT_DIM
                 status_text += " (Deceased)"
             
-            name_surf = self.font_main.render(rel.target_name, True, name_color)
-            type_surf = self.font_log.render(status_text, True, (120, 120, 120))
+            name_surf = render_text(self.font_main, rel.target_name, name_color)
+            type_surf = render_text(self.font_log, status_text, (120, 120, 120))
             
             screen.blit(name_surf, (x + 10, card_y + 5))
             
@@ -734,7 +761,7 @@ class RelationshipPanel:
                 attr_rect = pygame.Rect(x + 5, btn_y, btn_w, btn_h)
                 pygame.draw.rect(screen, (40, 40, 40), attr_rect, border_radius=4)
                 pygame.draw.rect(screen, (80, 80, 80), attr_rect, 1, border_radius=4)
-                attr_txt = self.font_log.render("Attributes", True, (200, 200, 200))
+                attr_txt = render_text(self.font_log, "Attributes", (200, 200, 200))
                 attr_txt_rect = attr_txt.get_rect(center=attr_rect.center)
                 screen.blit(attr_txt, attr_txt_rect)
 
@@ -742,7 +769,7 @@ class RelationshipPanel:
                 int_rect = pygame.Rect(x + 5 + btn_w + 5, btn_y, btn_w, btn_h)
                 pygame.draw.rect(screen, (40, 40, 40), int_rect, border_radius=4)
                 pygame.draw.rect(screen, (80, 80, 80), int_rect, 1, border_radius=4)
-                int_txt = self.font_log.render("Interact", True, (200, 200, 200))
+                int_txt = render_text(self.font_log, "Interact", (200, 200, 200))
                 int_txt_rect = int_txt.get_rect(center=int_rect.center)
                 screen.blit(int_txt, int_txt_rect)
         
@@ -844,7 +871,7 @@ class RelationshipPanel:
             # Ensure text is a string
             if not isinstance(text, str):
                 text = str(text)
-            s = self.font_log.render(text, True, color)
+            s = render_text(self.font_log, text, color)
             box_w = max(box_w, s.get_width())
             surfaces.append(s)
         
@@ -883,7 +910,7 @@ class RelationshipPanel:
     def _draw_ft_button(self, screen, rect, agent):
         """Draw a small family tree button."""
         # Simple FT button - just draw "FT" text for now
-        ft_surf = self.font_log.render("FT", True, (150, 150, 255))
+        ft_surf = render_text(self.font_log, "FT", (150, 150, 255))
         ft_rect = ft_surf.get_rect(center=rect.center)
         screen.blit(ft_surf, ft_rect)
 
@@ -240,7 +240,10 @@ class Agent:
             "Health", "Happiness", "IQ", "Looks", "Energy", "Fitness"
         ]
 
-        self.logger.info(f"Agent initialized ({'Player' if self.is_player else 'NPC'}): {self.first_name} {self.last_name} ({self.gender}) Age {self.age}")
+        self.logger.info(
+            "Agent initialized (%s): %s %s (%s) Age %s",
+            "Player" if self.is_player else "NPC", self.first_name, self.last_name, self.gender, self.age,
+        )
         
         # Recalculate aptitudes based on age development curves
         self._recalculate_aptitudes()
@@ -184,10 +184,10 @@ def _process_agent_monthly(sim_state, agent):
                 if agent.is_player:
                     sim_state.add_log("Caught skipping work! Performance penalized.", constants.COLOR_LOG_NEGATIVE)
                 else:
-                    logger.debug(f"NPC {agent.first_name} caught skipping work")
+                    logger.debug("NPC %s caught skipping work", agent.first_name)
         else:
             # Skipped undetected
-            logger.debug(f"{agent.first_name} skipped {skipped_hours:.1f}h undetected")
+            logger.debug("%s skipped %.1fh undetected", agent.first_name, skipped_hours)
     
     # I. Economics (Salary)
     if agent.job:
@@ -198,7 +198,7 @@ def _process_agent_monthly(sim_state, agent):
             sim_state.add_log(f"Earned ${monthly_salary} from {agent.job['title']}.", constants.COLOR_LOG_POSITIVE)
         else:
             # Log to debug only to avoid spam
-            logger.debug(f"NPC {agent.first_name} earned ${monthly_salary}")
+            logger.debug("NPC %s earned $%s", agent.first_name, monthly_salary)
 
     # J. Mortality Check
     # Enforce biological cap
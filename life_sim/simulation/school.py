@@ -739,7 +739,7 @@ def _handle_school_start(sim_state, agent, school_sys):
             # TRIGGER POPULATION HERE
             sim_state.populate_classmates()
         
-        logger.info(f"Agent {agent.first_name} enrolled in {grade_data['name']} Form {form_label}")
+        logger.info("Agent %s enrolled in %s Form %s", agent.first_name, grade_data['name'], form_label)
 
 def _handle_school_end(sim_state, agent, school_sys):
     """Ends the school year, handles passing/failing/graduation."""
@@ -127,15 +127,13 @@ class SimState:
             household_wealth = m.money + f.money
             
             # 1. The Setting (Season + City)
-            # Use same season logic as background system
-            if self.month_index in [11, 0, 1]:
-                season = "a quiet, snowy morning"
-            elif self.month_index in [2, 3, 4]:
-                season = "a quiet, spring morning"
-            elif self.month_index in [5, 6, 7]:
-                season = "a quiet, summer morning"
-            else:  # [8, 9, 10]
-                season = "a quiet, autumn morning"
+            # Use same season table as background system
+            season = {
+                "winter": "a quiet, snowy morning",
+                "spring": "a quiet, spring morning",
+                "summer": "a quiet, summer morning",
+                "autumn": "a quiet, autumn morning",
+            }[constants.SEASON_BY_MONTH[self.month_index]]
             intro = f"You enter the world in {self.player.city} during {season}."
             
             # 2. The Room Atmosphere (Wealth x Love Matrix)
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from life_sim.rendering.quadtree import build_quadtree, repulsion_forces
+
+
+def exact_repulsion(pos, strength):
+    diff = pos[:, np.newaxis, :] - pos[np.newaxis, :, :]
+    dist_sq = np.sum(diff ** 2, axis=2)
+    np.fill_diagonal(dist_sq, np.inf)
+    dist_sq = np.maximum(dist_sq, 1.0)
+    return np.sum(diff * (strength / dist_sq)[:, :, np.newaxis], axis=1)
+
+
+class SocialGraphQuadtreeTests(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(7)
+
+    def test_tree_mass_covers_every_node(self):
+        pos = self.rng.uniform(0, 1000, size=(300, 2))
+        root = build_quadtree(pos, leaf_size=4)
+        self.assertEqual(root.mass, 300)
+        np.testing.assert_allclose(root.com, pos.mean(axis=0))
+
+        seen = []
+        stack = [root]
+        while stack:
+            cell = stack.pop()
+            if cell.indices is not None:
+                seen.extend(cell.indices.tolist())
+            stack.extend(cell.children)
+        self.assertEqual(sorted(seen), list(range(300)))
+
+    def test_theta_zero_matches_exact_kernel(self):
+        pos = self.rng.uniform(0, 800, size=(120, 2))
+        np.testing.assert_allclose(
+            repulsion_forces(pos, 500.0, theta=0.0),
+            exact_repulsion(pos, 500.0),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+    def test_default_theta_stays_close_to_exact_kernel(self):
+        pos = self.rng.uniform(0, 1500, size=(600, 2))
+        exact = exact_repulsion(pos, 500.0)
+        approx = repulsion_forces(pos, 500.0)
+        rel_error = np.linalg.norm(approx - exact) / np.linalg.norm(exact)
+        self.assertLess(rel_error, 0.05)
+
+    def test_coincident_nodes_do_not_recurse_forever(self):
+        pos = np.zeros((50, 2))
+        forces = repulsion_forces(pos, 500.0, leaf_size=2)
+        self.assertTrue(np.all(forces == 0.0))
+
+    def test_empty_input(self):
+        self.assertIsNone(build_quadtree(np.zeros((0, 2))))
+        self.assertEqual(repulsion_forces(np.zeros((0, 2)), 500.0).shape, (0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()